@@ -1,44 +1,124 @@
-# Gör det lättare att importera i resten av projektet
-from .club import Club
-from .cup import Cup, CupMatch, CupRules, generate_cup_bracket
-from .cup_state import CupState, advance_cup_round, create_cup_state, finish_cup
-from .fixtures import Match, round_robin
-from .generator import generate_club, generate_league, to_preview_dict
-from .history import HistoryStore, SeasonRecord
-from .league import Division, League, LeagueRules
-from .livefeed import build_timeline, format_feed, format_match_report
-from .match import (  # <-- stubbarna
-    EventType,
-    MatchResult,
-    PlayerEvent,
-    Referee,
-    TeamStats,
-    simulate_match,
-)
-from .player import Player, Position, Trait
-from .ratings import compute_ratings_for_match, player_match_rating
-from .schedule import build_league_schedule
-from .season import SeasonConfig, play_cup, play_league, play_round
-from .serialize import (
-    club_from_dict,
-    club_to_dict,
-    fixtures_from_dict,
-    fixtures_to_dict,
-    league_from_dict,
-    league_to_dict,
-    player_from_dict,
-    player_to_dict,
-)
-from .standings import TableRow, apply_result_to_table, best_xi_442, sort_table
-from .state import GameState
-from .tactics import (
-    TACTICS,
-    Aggression,
-    TacticName,
-    TacticProfile,
-    aggression_modifiers,
-    unit_scores,
-)
+# Gör det lättare att importera i resten av projektet.
+# Exporterna laddas lat (PEP 562): undermodulen importeras först när namnet
+# används, så att t.ex. `cli --help` slipper dra in hela motorn.
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .club import Club
+    from .cup import Cup, CupMatch, CupRules, generate_cup_bracket
+    from .cup_state import CupState, advance_cup_round, create_cup_state, finish_cup
+    from .fixtures import Match, round_robin
+    from .generator import generate_club, generate_league, to_preview_dict
+    from .history import HistoryStore, SeasonRecord
+    from .league import Division, League, LeagueRules
+    from .livefeed import build_timeline, format_feed, format_match_report
+    from .match import (  # <-- stubbarna
+        EventType,
+        MatchResult,
+        PlayerEvent,
+        Referee,
+        TeamStats,
+        simulate_match,
+    )
+    from .player import Player, Position, Trait
+    from .ratings import compute_ratings_for_match, player_match_rating
+    from .schedule import build_league_schedule
+    from .season import (
+        SeasonConfig,
+        play_cup,
+        play_league,
+        play_round,
+        simulate_matches,
+    )
+    from .serialize import (
+        club_from_dict,
+        club_to_dict,
+        fixtures_from_dict,
+        fixtures_to_dict,
+        league_from_dict,
+        league_to_dict,
+        player_from_dict,
+        player_to_dict,
+    )
+    from .standings import (
+        TableRow,
+        apply_result_to_table,
+        apply_results_to_table,
+        best_xi_442,
+        sort_table,
+    )
+    from .state import GameState
+    from .tactics import (
+        TACTICS,
+        Aggression,
+        TacticName,
+        TacticProfile,
+        aggression_modifiers,
+        unit_scores,
+    )
+
+_EXPORTS = {
+    "Club": ".club",
+    "Cup": ".cup",
+    "CupMatch": ".cup",
+    "CupRules": ".cup",
+    "generate_cup_bracket": ".cup",
+    "CupState": ".cup_state",
+    "advance_cup_round": ".cup_state",
+    "create_cup_state": ".cup_state",
+    "finish_cup": ".cup_state",
+    "Match": ".fixtures",
+    "round_robin": ".fixtures",
+    "generate_club": ".generator",
+    "generate_league": ".generator",
+    "to_preview_dict": ".generator",
+    "HistoryStore": ".history",
+    "SeasonRecord": ".history",
+    "Division": ".league",
+    "League": ".league",
+    "LeagueRules": ".league",
+    "build_timeline": ".livefeed",
+    "format_feed": ".livefeed",
+    "format_match_report": ".livefeed",
+    "EventType": ".match",
+    "MatchResult": ".match",
+    "PlayerEvent": ".match",
+    "Referee": ".match",
+    "TeamStats": ".match",
+    "simulate_match": ".match",
+    "Player": ".player",
+    "Position": ".player",
+    "Trait": ".player",
+    "compute_ratings_for_match": ".ratings",
+    "player_match_rating": ".ratings",
+    "build_league_schedule": ".schedule",
+    "SeasonConfig": ".season",
+    "play_cup": ".season",
+    "play_league": ".season",
+    "play_round": ".season",
+    "simulate_matches": ".season",
+    "club_from_dict": ".serialize",
+    "club_to_dict": ".serialize",
+    "fixtures_from_dict": ".serialize",
+    "fixtures_to_dict": ".serialize",
+    "league_from_dict": ".serialize",
+    "league_to_dict": ".serialize",
+    "player_from_dict": ".serialize",
+    "player_to_dict": ".serialize",
+    "TableRow": ".standings",
+    "apply_result_to_table": ".standings",
+    "apply_results_to_table": ".standings",
+    "best_xi_442": ".standings",
+    "sort_table": ".standings",
+    "GameState": ".state",
+    "TACTICS": ".tactics",
+    "Aggression": ".tactics",
+    "TacticName": ".tactics",
+    "TacticProfile": ".tactics",
+    "aggression_modifiers": ".tactics",
+    "unit_scores": ".tactics",
+}
 
 __all__ = [
     "Player",
@@ -74,6 +154,7 @@ __all__ = [
     "aggression_modifiers",
     "TableRow",
     "apply_result_to_table",
+    "apply_results_to_table",
     "sort_table",
     "best_xi_442",
     "HistoryStore",
@@ -82,6 +163,7 @@ __all__ = [
     "play_round",
     "play_league",
     "play_cup",
+    "simulate_matches",
     "player_match_rating",
     "compute_ratings_for_match",
     "player_to_dict",
@@ -101,3 +183,16 @@ __all__ = [
     "format_feed",
     "format_match_report",
 ]
+
+
+def __getattr__(name: str):
+    mod = _EXPORTS.get(name)
+    if mod is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(mod, __name__), name)
+    globals()[name] = value  # nästa åtkomst går direkt via modulens dict
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
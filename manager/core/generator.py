@@ -4,7 +4,7 @@ import csv
 import random
 from dataclasses import asdict
 from pathlib import Path
-from typing import List, Sequence
+from typing import List, Sequence, Tuple
 
 from .club import Club
 from .league import Division, League, LeagueRules
@@ -99,21 +99,18 @@ def _gen_player(next_id: int, position: Position, taken_numbers: set[int]) -> Pl
     )
 
 
+# Fördelning för 21 spelare, utplattad till en position per truppplats
+_SQUAD_LAYOUT: Tuple[Position, ...] = (
+    (Position.GK,) * 2 + (Position.DF,) * 7 + (Position.MF,) * 7 + (Position.FW,) * 5
+)
+
+
 def generate_club(name: str, *, squad_size: int = 21, start_id: int = 1) -> Club:
-    # Fördelning för 21 spelare
-    layout = [
-        (Position.GK, 2),
-        (Position.DF, 7),
-        (Position.MF, 7),
-        (Position.FW, 5),
-    ]
-    players: List[Player] = []
     taken_numbers: set[int] = set()
-    nid = start_id
-    for pos, count in layout:
-        for _ in range(count):
-            players.append(_gen_player(nid, pos, taken_numbers))
-            nid += 1
+    players: List[Player] = [
+        _gen_player(nid, pos, taken_numbers)
+        for nid, pos in enumerate(_SQUAD_LAYOUT, start=start_id)
+    ]
     return Club(name=name, players=players, cash_sek=0)
 
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 
 @dataclass(slots=True)
@@ -11,6 +11,22 @@ class SeasonRecord:
     cup_result: Optional[str] = None  # "Vinnare", "Final", "Semi", "Kvarts" etc.
 
 
+def _record_to_dict(r: SeasonRecord) -> Dict[str, Any]:
+    return {
+        "season": r.season,
+        "league_position": r.league_position,
+        "cup_result": r.cup_result,
+    }
+
+
+def _record_from_dict(d: Dict[str, Any]) -> SeasonRecord:
+    return SeasonRecord(
+        season=int(d.get("season", 1)),
+        league_position=d.get("league_position"),
+        cup_result=d.get("cup_result"),
+    )
+
+
 class HistoryStore:
     """
     Enkel in-memory-butik. Nycklar: klubbnamn (str).
@@ -32,3 +48,25 @@ class HistoryStore:
 
     def snapshot(self) -> Dict[str, List[SeasonRecord]]:
         return self._store.copy()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """{klubbnamn: [SeasonRecord som dict, ...]} för sparfilen."""
+        return {
+            club: [_record_to_dict(r) for r in records]
+            for club, records in self._store.items()
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "HistoryStore":
+        """
+        Bygger SeasonRecord-objekten en gång vid inläsning, så att all_for och
+        snapshot alltid ger typade poster. Äldre sparfiler: {"_store": {...}}.
+        """
+        if set(d) == {"_store"} and isinstance(d["_store"], dict):
+            d = d["_store"]
+        store = cls()
+        store._store = {
+            club: list(map(_record_from_dict, records or []))
+            for club, records in d.items()
+        }
+        return store
@@ -12,6 +12,9 @@ class LeagueRules:
     teams_per_div: int = 16
     levels: int = 1
     double_round: bool = True
+    # Antal lag som flyttas upp/ned mellan intilliggande divisioner vid säsongsslut
+    promote: int = 0
+    relegate: int = 0
 
 
 @dataclass(slots=True)
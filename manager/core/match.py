@@ -102,45 +102,43 @@ def _avg_skill(players: List[Player]) -> float:
     return sum(getattr(p, "skill_open", 5) for p in players) / len(players)
 
 
-def _pick_lineup(club: Club, n: int = 11) -> List[Player]:
+def _pick_lineup(club: Club, n: int = 11, rng=random) -> List[Player]:
     """Enkel elvaväljare: ta de första 11, fyll upp med slump om färre."""
     ps = list(club.players)
     if len(ps) >= n:
         return ps[:n]
     while len(ps) < n and club.players:
-        ps.append(random.choice(club.players))
+        ps.append(rng.choice(club.players))
     return ps[:n]
 
 
-def _choose_weighted(players: List[Player], role: str) -> Player:
+# Positionsvikter per roll (hissade ur loopen, okänd position → GK-vikten)
+_GK = Position.GK
+_SCORER_WEIGHTS: Dict[Position, float] = {
+    Position.FW: 6.0,
+    Position.MF: 3.0,
+    Position.DF: 1.5,
+    Position.GK: 0.3,
+}
+_ASSIST_WEIGHTS: Dict[Position, float] = {
+    Position.MF: 6.0,
+    Position.FW: 3.0,
+    Position.DF: 1.3,
+    Position.GK: 0.2,
+}
+
+
+def _choose_weighted(players: List[Player], role: str, rng=random) -> Player:
     """
     Välj en spelare med vikt beroende på position/roll:
     - scorer: FW > MF > DF > GK
     - assister: MF > FW > DF > GK
     """
+    table = _SCORER_WEIGHTS if role == "scorer" else _ASSIST_WEIGHTS
+    fallback = table[_GK]
     weights = []
     for p in players:
-        pos = getattr(p, "position", None)
-        base = 1.0
-        if role == "scorer":
-            if pos == Position.FW:
-                base = 6.0
-            elif pos == Position.MF:
-                base = 3.0
-            elif pos == Position.DF:
-                base = 1.5
-            else:
-                base = 0.3
-        else:  # assister
-            if pos == Position.MF:
-                base = 6.0
-            elif pos == Position.FW:
-                base = 3.0
-            elif pos == Position.DF:
-                base = 1.3
-            else:
-                base = 0.2
-
+        base = table.get(p.position, fallback)
         base *= 0.8 + 0.02 * getattr(p, "skill_open", 5)
         if role == "scorer" and Trait.STRAFFSPECIALIST in getattr(p, "traits", []):
             base *= 1.15
@@ -148,31 +146,31 @@ def _choose_weighted(players: List[Player], role: str) -> Player:
             base *= 1.10
         weights.append(max(0.05, base))
 
-    r = random.random() * sum(weights)
+    r = rng.random() * sum(weights)
     acc = 0.0
     for p, w in zip(players, weights):
         acc += w
         if r <= acc:
             return p
-    return random.choice(players)
+    return rng.choice(players)
 
 
 def _keeper_skill(players: List[Player]) -> float:
     """Bästa GK i elvan, annars låg nivå."""
-    gks = [p for p in players if getattr(p, "position", None) == Position.GK]
+    gks = [p for p in players if p.position is _GK]
     if not gks:
         return 4.5
     return max(getattr(p, "skill_open", 5) for p in gks)
 
 
-def _poisson(lmbd: float) -> int:
+def _poisson(lmbd: float, rng=random) -> int:
     """Knuths algoritm för Poisson-dragning."""
     L = math.exp(-lmbd)
     k = 0
     p = 1.0
     while True:
         k += 1
-        p *= random.random()
+        p *= rng.random()
         if p <= L:
             return k - 1
 
@@ -191,6 +189,7 @@ def simulate_match(
     away_tactic,
     home_aggr,
     away_aggr,
+    rng: Optional[random.Random] = None,
 ) -> MatchResult:
     """
     Poisson-styrd målmodell:
@@ -200,10 +199,13 @@ def simulate_match(
       4) Tilldela målskytt/assist och händelsetider
       5) Kort/fouls/straffar/offsides/skador m.m.
       6) Spelar-betyg från prestation
+    `rng` (t.ex. random.Random(seed)) ger en egen slumpström per match; utan den
+    används den globala random-modulen.
     """
+    rnd = random if rng is None else rng
     # 1) Elvor och grundparametrar
-    home_xi = _pick_lineup(home)
-    away_xi = _pick_lineup(away)
+    home_xi = _pick_lineup(home, rng=rnd)
+    away_xi = _pick_lineup(away, rng=rnd)
 
     sH = _avg_skill(home_xi)
     sA = _avg_skill(away_xi)
@@ -252,13 +254,13 @@ def simulate_match(
     xg_away = max(0.2, min(3.2, xg_away))
 
     # 2) Dra antal mål
-    goals_home = _poisson(xg_home)
-    goals_away = _poisson(xg_away)
+    goals_home = _poisson(xg_home, rnd)
+    goals_away = _poisson(xg_away, rnd)
 
     # 3) Syntetisera skott/avslut mm. utifrån mål
     # Skapa rimliga totalsiffror: ca 8–16 skott/lag, ~30–40% on target, 60–80% saves av on-target
     def synth_stats(goals: int, xg: float, gk_vs: float) -> TeamStats:
-        shots = max(3, int(random.gauss(10 + 2 * (xg - 1.0), 2.8)))
+        shots = max(3, int(rnd.gauss(10 + 2 * (xg - 1.0), 2.8)))
         on_ratio = 0.30 + 0.04 * (xg - 1.0)  # 26–40 %
         shots_on = max(goals, int(shots * max(0.22, min(0.42, on_ratio))))
         # säkra att skott på mål >= mål
@@ -267,9 +269,9 @@ def simulate_match(
         saves = max(
             0, min(shots_on - goals, int(shots_on * max(0.45, min(0.90, save_ratio))))
         )
-        corners = max(0, int(shots * random.uniform(0.15, 0.30)))
-        woodwork = 1 if random.random() < 0.08 else 0
-        offsides = int(random.random() < 0.25) + (1 if random.random() < 0.15 else 0)
+        corners = max(0, int(shots * rnd.uniform(0.15, 0.30)))
+        woodwork = 1 if rnd.random() < 0.08 else 0
+        offsides = int(rnd.random() < 0.25) + (1 if rnd.random() < 0.15 else 0)
 
         return TeamStats(
             goals=goals,
@@ -292,18 +294,18 @@ def simulate_match(
 
     def add_goals(team_players: List[Player], goals: int):
         minutes = sorted(
-            random.sample(range(2, 90), k=min(goals, 8))
+            rnd.sample(range(2, 90), k=min(goals, 8))
         )  # max 8 tidsstämplar, flera mål kan hamna i samma minut
         if goals > len(minutes):
-            extra = [random.choice(minutes) for _ in range(goals - len(minutes))]
+            extra = [rnd.choice(minutes) for _ in range(goals - len(minutes))]
             minutes += extra
             minutes.sort()
         for m in minutes:
-            scorer = _choose_weighted(team_players, "scorer")
+            scorer = _choose_weighted(team_players, "scorer", rnd)
             assister = None
-            if random.random() < 0.60:  # assist ganska vanligt
+            if rnd.random() < 0.60:  # assist ganska vanligt
                 pool = [p for p in team_players if p is not scorer]
-                assister = _choose_weighted(pool, "assister") if pool else None
+                assister = _choose_weighted(pool, "assister", rnd) if pool else None
             events.append(PlayerEvent(EventType.GOAL, m, scorer, assist_by=assister))
 
     add_goals(home_xi, goals_home)
@@ -314,26 +316,26 @@ def simulate_match(
         # fouls/kort
         aggr = getattr(home_aggr if is_home else away_aggr, "name", "Medel").lower()
         aggr_factor = 1.25 if "aggress" in aggr else (0.85 if "lugn" in aggr else 1.0)
-        base_fouls = int(random.gauss(10, 3))
+        base_fouls = int(rnd.gauss(10, 3))
         fouls = max(4, int(base_fouls * aggr_factor))
         stats.fouls = fouls
         for _ in range(fouls):
-            minute = random.randint(3, 88)
-            victim = random.choice(team_players)
+            minute = rnd.randint(3, 88)
+            victim = rnd.choice(team_players)
             events.append(PlayerEvent(EventType.FOUL, minute, victim))
             # kortbedömning
-            if random.random() < 0.10 * aggr_factor * (
+            if rnd.random() < 0.10 * aggr_factor * (
                 1 + 0.06 * (referee.hardness - 5)
             ):
                 stats.yellows += 1
                 events.append(PlayerEvent(EventType.YELLOW, minute, victim))
-                if random.random() < 0.08:  # andra gula
+                if rnd.random() < 0.08:  # andra gula
                     stats.reds += 1
                     events.append(PlayerEvent(EventType.RED, minute, victim))
 
         # straffar – mer sällan (ca 0.1–0.2 / match)
-        if random.random() < 0.12:
-            minute = random.randint(5, 85)
+        if rnd.random() < 0.12:
+            minute = rnd.randint(5, 85)
             taker = next(
                 (
                     p
@@ -343,11 +345,11 @@ def simulate_match(
                 None,
             )
             if not taker:
-                taker = _choose_weighted(team_players, "scorer")
+                taker = _choose_weighted(team_players, "scorer", rnd)
             events.append(PlayerEvent(EventType.PENALTY_AWARDED, minute, taker))
             gk = gkA if is_home else gkH
             p_score = 0.74 - 0.02 * (gk - 5)
-            if random.random() < p_score:
+            if rnd.random() < p_score:
                 stats.goals += 1
                 events.append(PlayerEvent(EventType.PENALTY_SCORED, minute, taker))
                 events.append(PlayerEvent(EventType.GOAL, minute, taker))
@@ -359,20 +361,20 @@ def simulate_match(
             events.append(
                 PlayerEvent(
                     EventType.OFFSIDE,
-                    random.randint(2, 88),
-                    _choose_weighted(team_players, "scorer"),
+                    rnd.randint(2, 88),
+                    _choose_weighted(team_players, "scorer", rnd),
                 )
             )
         for _ in range(stats.woodwork):
             events.append(
                 PlayerEvent(
                     EventType.WOODWORK,
-                    random.randint(2, 88),
-                    _choose_weighted(team_players, "scorer"),
+                    rnd.randint(2, 88),
+                    _choose_weighted(team_players, "scorer", rnd),
                 )
             )
         for _ in range(stats.corners):
-            events.append(PlayerEvent(EventType.CORNER, random.randint(2, 88)))
+            events.append(PlayerEvent(EventType.CORNER, rnd.randint(2, 88)))
 
     distribute_misc(home_xi, H, True)
     distribute_misc(away_xi, A, False)
@@ -386,11 +388,11 @@ def simulate_match(
             trait_names = {getattr(t, "name", str(t)).upper() for t in traits}
             if {"SKADEBENÄGEN", "SKADBENÄGEN", "SKADEBENAGEN"} & trait_names:
                 risk += 0.010
-            if random.random() < risk:
+            if rnd.random() < risk:
                 n += 1
-                events.append(PlayerEvent(EventType.INJURY, random.randint(10, 85), p))
+                events.append(PlayerEvent(EventType.INJURY, rnd.randint(10, 85), p))
         for _ in range(n):
-            events.append(PlayerEvent(EventType.SUBSTITUTION, random.randint(12, 88)))
+            events.append(PlayerEvent(EventType.SUBSTITUTION, rnd.randint(12, 88)))
 
     injuries(home_xi)
     injuries(away_xi)
@@ -416,7 +418,7 @@ def simulate_match(
 
     for p in home_xi + away_xi:
         base = (
-            6.2 + 0.12 * (getattr(p, "skill_open", 5) - 5) + random.uniform(-0.6, 0.6)
+            6.2 + 0.12 * (getattr(p, "skill_open", 5) - 5) + rnd.uniform(-0.6, 0.6)
         )
         base += impact.get(p.id, 0.0)
         if Trait.LEDARE in getattr(p, "traits", []):
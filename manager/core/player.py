@@ -26,6 +26,18 @@ class Trait(Enum):
     KORTBENAGEN = auto()  # negativ
 
 
+def trait_bit(t: Trait) -> int:
+    """Bit för en trait i Player.trait_mask."""
+    return 1 << t.value
+
+
+def traits_mask(traits: List[Trait]) -> int:
+    m = 0
+    for t in traits:
+        m |= 1 << t.value
+    return m
+
+
 @dataclass(slots=True)
 class Player:
     id: int
@@ -44,6 +56,15 @@ class Player:
     form_season: int = 10  # 1–20
 
     traits: List[Trait] = field(default_factory=list)
+    # Härledd bitmask av traits (O(1)-test); räknas om via set_traits()
+    trait_mask: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.trait_mask = traits_mask(self.traits)
+
+    def set_traits(self, traits: List[Trait]) -> None:
+        self.traits = list(traits)
+        self.trait_mask = traits_mask(self.traits)
 
     @property
     def full_name(self) -> str:
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import dataclass field
-from typing import Literal
+import random
+from dataclasses import dataclass, field
+from functools import partial
+from math import ceil
+from typing import Callable, Dict, List, Literal, Tuple
 
 from .fixtures import Match, round_robin
 from .league import Division, League
-from .match import Referee, simulate_match
+from .match import MatchResult, Referee, simulate_match
 
 # ---------------------------
 # Enkla taktiker & attityd
@@ -106,17 +109,114 @@ def _simulate_fixture(m: Match, cfg: SeasonConfig):
     )
 
 
-def play_round(fixtures: List[Match], round_no: int, cfg: SeasonConfig) -> List:
+# Simulerar en fixture; måste gå att pickla (modulfunktion eller partial av en)
+_Simulate = Callable[[Match], MatchResult]
+
+
+def _play_worker(job: Tuple[List[Match], _Simulate, int]) -> List[MatchResult]:
+    fixtures, simulate, seed = job
+    # Egen seed per block: forkade processer ärver annars samma slumptillstånd
+    random.seed(seed)
+    return [simulate(m) for m in fixtures]
+
+
+def _rebind_result(res: MatchResult, m: Match) -> None:
+    """Peka om ett resultat från en arbetsprocess till fixturens egna objekt."""
+    orig = dict(zip(map(id, res.home.players), m.home.players))
+    orig.update(zip(map(id, res.away.players), m.away.players))
+    for ev in res.events:
+        if ev.player is not None:
+            ev.player = orig.get(id(ev.player), ev.player)
+        if ev.assist_by is not None:
+            ev.assist_by = orig.get(id(ev.assist_by), ev.assist_by)
+    res.home = m.home
+    res.away = m.away
+
+
+def _simulate_all(
+    matches: List[Match], simulate: _Simulate, workers: int
+) -> List[MatchResult]:
+    """
+    Kör `simulate` för varje match, i fixturordning.
+    Med workers > 1 delas matcherna i block som simuleras i separata processer;
+    resultaten pekar ändå på samma Club/Player-objekt som vid seriell körning.
+    """
+    if workers <= 1 or len(matches) < 2:
+        return [simulate(m) for m in matches]
+
+    n = min(workers, len(matches))
+    size = ceil(len(matches) / n)
+    jobs = [
+        (matches[i : i + size], simulate, random.getrandbits(64))
+        for i in range(0, len(matches), size)
+    ]
+    from concurrent.futures import ProcessPoolExecutor
+
+    results: List[MatchResult] = []
+    with ProcessPoolExecutor(max_workers=n) as pool:
+        for part in pool.map(_play_worker, jobs):
+            results.extend(part)
+    for res, m in zip(results, matches):
+        _rebind_result(res, m)
+    return results
+
+
+def fixtures_by_round(fixtures: List[Match]) -> Dict[int, List[Match]]:
+    """Delar upp ett schema per rond (schemaordningen behålls inom ronden)."""
+    buckets: Dict[int, List[Match]] = {}
+    for m in fixtures:
+        r = getattr(m, "round", 0)
+        bucket = buckets.get(r)
+        if bucket is None:
+            buckets[r] = [m]
+        else:
+            bucket.append(m)
+    return buckets
+
+
+def play_round(
+    fixtures: List[Match], round_no: int, cfg: SeasonConfig, workers: int = 1
+) -> List:
+    """Spela alla matcher i rond `round_no` (workers > 1 → se _simulate_all)."""
     todays = [m for m in fixtures if getattr(m, "round", 0) == int(round_no)]
-    return [_simulate_fixture(m, cfg) for m in todays]
+    return _simulate_all(todays, partial(_simulate_fixture, cfg=cfg), workers)
+
+
+def _simulate_with(m: Match, **kwargs) -> MatchResult:
+    return simulate_match(m.home, m.away, **kwargs)
+
+
+def simulate_matches(
+    matches: List[Match],
+    *,
+    referee: Referee,
+    home_tactic,
+    away_tactic,
+    home_aggr,
+    away_aggr,
+    workers: int = 1,
+) -> List[MatchResult]:
+    """
+    Som simulate_match för en lista fixtures med gemensam domare/taktik
+    (till skillnad från play_round, som använder klubbarnas egna inställningar).
+    """
+    simulate = partial(
+        _simulate_with,
+        referee=referee,
+        home_tactic=home_tactic,
+        away_tactic=away_tactic,
+        home_aggr=home_aggr,
+        away_aggr=away_aggr,
+    )
+    return _simulate_all(matches, simulate, workers)
 
 
 def play_league(div: Division, fixtures: List[Match], cfg: SeasonConfig) -> List:
-    max_round = max((getattr(m, "round", 0) for m in fixtures), default=0)
+    buckets = fixtures_by_round(fixtures)
+    max_round = max(buckets, default=0)
     all_results = []
     for r in range(1, max_round + 1):
-        todays = [m for m in fixtures if getattr(m, "round", 0) == r]
-        for m in todays:
+        for m in buckets.get(r, ()):
             all_results.append(_simulate_fixture(m, cfg))
     return all_results
 
@@ -6,7 +6,7 @@ from typing import Dict, List, Tuple
 
 from .club import Club
 from .fixtures import Match, round_robin  # <-- använd direkt här
-from .player import Player
+from .player import Player, Trait, trait_bit
 
 
 @dataclass(slots=True)
@@ -27,14 +27,15 @@ class PlayerProgress:
     note: str = ""
 
 
-def _has_trait(p: Player, *names: str) -> bool:
-    traits = getattr(p, "traits", []) or []
-    names_u = {n.upper() for n in names}
-    for t in traits:
-        nm = getattr(t, "name", str(t)).upper()
-        if nm in names_u:
-            return True
-    return False
+# Trait-masker för _has_trait
+_TRAINING_KEEN = trait_bit(Trait.TRANINGSVILLIG)
+_LEADER = trait_bit(Trait.LEDARE)
+_INTELLIGENT = trait_bit(Trait.INTELLIGENT)
+_INJURY_PRONE = trait_bit(Trait.SKADEBENAGEN)
+
+
+def _has_trait(p: Player, mask: int) -> bool:
+    return (p.trait_mask & mask) != 0
 
 
 def _age_factors(age: int) -> Tuple[float, float]:
@@ -124,13 +125,13 @@ def _progress_player(
         loss = False
 
     gain_f, loss_f = _age_factors(age)
-    if _has_trait(p, "TRÄNINGSVILLIG", "TRAININGSVILLIG"):
+    if _has_trait(p, _TRAINING_KEEN):
         gain_f *= 1.20
-    if _has_trait(p, "LEDARE"):
+    if _has_trait(p, _LEADER):
         gain_f *= 1.05
-    if _has_trait(p, "INTELLIGENT"):
+    if _has_trait(p, _INTELLIGENT):
         gain_f *= 1.05
-    if _has_trait(p, "SKADEBENÄGEN", "SKADBENÄGEN", "SKADEBENAGEN"):
+    if _has_trait(p, _INJURY_PRONE):
         loss_f *= 1.25
     if captain_id is not None and p.id == captain_id:
         gain_f *= 1.05
@@ -360,7 +361,7 @@ def end_season(gs) -> List[PlayerProgress]:
 
     # 4) Nollställ inför ny säsong
     gs.current_round = 1
-    gs.table_snapshot = {}
+    gs.table_snapshot.clear()  # behåller defaultdict-typen från ensure_containers
     gs.cup_state = None  # ny cup startas separat nästa säsong
 
     # 5) Returnera progressionen för rapport
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import json
+from dataclasses import fields, is_dataclass
+from sys import intern
 from typing import Any, Dict, List, Optional
 
 from . import stats as stats_mod  # Player/Club stats dataklasser (om finns)
@@ -11,6 +13,11 @@ from .league import Division, League, LeagueRules
 from .player import Player, Position, Trait
 from .season import Aggressiveness, Tactic
 
+try:  # valfritt: orjson läser/skriver JSON betydligt snabbare om det finns
+    import orjson
+except ImportError:  # pragma: no cover - stdlib-json används då
+    orjson = None
+
 # -------------------------------------------------------------------
 # PLAYER
 # -------------------------------------------------------------------
@@ -125,7 +132,8 @@ def club_to_dict(c: Club) -> Dict[str, Any]:
 
 def club_from_dict(d: Dict[str, Any]) -> Club:
     c = Club(
-        name=d["name"],
+        # Internerade klubbnamn delas med stats, matchlogg och tabell (se nedan)
+        name=intern(d["name"]),
         players=[player_from_dict(x) for x in d.get("players", [])],
         cash_sek=int(d.get("cash_sek", 0)),
     )
@@ -286,22 +294,19 @@ def cup_state_from_dict(d: Optional[Dict[str, Any]], league: League):
         c.name: c for div in league.divisions for c in div.clubs
     }
 
-    cs = CupState(rules=rules)
-    cs.current_clubs = [
-        club_index[name] for name in d.get("current_clubs", []) if name in club_index
-    ]
-    cs.finished = bool(d.get("finished", False))
+    # CupState är en slots-dataklass: bara rules/current_clubs/finished/winner
+    # (round_index/queued_fixtures i äldre filer saknar motsvarighet och ignoreras)
     wname = d.get("winner")
-    cs.winner = club_index.get(wname) if wname else None
-    cs.round_index = int(d.get("round_index", 0))
-
-    qf = []
-    for item in d.get("queued_fixtures", []) or []:
-        h = club_index.get(item.get("home"))
-        a = club_index.get(item.get("away"))
-        if h and a:
-            qf.append(Match(home=h, away=a, round=0))
-    cs.queued_fixtures = qf
+    cs = CupState(
+        rules=rules,
+        current_clubs=[
+            club_index[name]
+            for name in d.get("current_clubs", [])
+            if name in club_index
+        ],
+        finished=bool(d.get("finished", False)),
+        winner=club_index.get(wname) if wname else None,
+    )
 
     return cs
 
@@ -311,40 +316,41 @@ def cup_state_from_dict(d: Optional[Dict[str, Any]], league: League):
 # -------------------------------------------------------------------
 
 
-def training_orders_to_list(gs) -> list:
-    arr = []
-    for o in getattr(gs, "training_orders", []) or []:
-        arr.append(
-            {
-                "id": int(getattr(o, "id", 0)),
-                "club_name": getattr(o, "club_name", ""),
-                "player_id": int(getattr(o, "player_id", 0)),
-                "weeks_left": int(getattr(o, "weeks_left", 0)),
-                "cost_sek": int(getattr(o, "cost_sek", 200_000)),
-                "status": getattr(o, "status", "active"),
-                "note": getattr(o, "note", ""),
-            }
-        )
-    return arr
+def training_order_to_dict(o) -> Dict[str, Any]:
+    # TrainingOrder är en platt slots-dataklass av primitiver → direkt fältåtkomst
+    return {
+        "id": o.id,
+        "club_name": o.club_name,
+        "player_id": o.player_id,
+        "weeks_left": o.weeks_left,
+        "cost_sek": o.cost_sek,
+        "status": o.status,
+        "note": o.note,
+    }
 
 
-def training_orders_from_list(arr: list):
+def training_order_from_dict(d: Dict[str, Any]):
     from .training import TrainingOrder  # lokal import
 
-    out = []
-    for d in arr or []:
-        out.append(
-            TrainingOrder(
-                id=int(d.get("id", 0)),
-                club_name=d.get("club_name", ""),
-                player_id=int(d.get("player_id", 0)),
-                weeks_left=int(d.get("weeks_left", 0)),
-                cost_sek=int(d.get("cost_sek", 200_000)),
-                status=d.get("status", "active"),
-                note=d.get("note", ""),
-            )
-        )
-    return out
+    return TrainingOrder(
+        id=int(d.get("id", 0)),
+        club_name=intern(d.get("club_name", "")),
+        player_id=int(d.get("player_id", 0)),
+        weeks_left=int(d.get("weeks_left", 0)),
+        cost_sek=int(d.get("cost_sek", 200_000)),
+        status=d.get("status", "active"),
+        note=d.get("note", ""),
+    )
+
+
+def training_orders_to_list(gs) -> list:
+    return [
+        training_order_to_dict(o) for o in (getattr(gs, "training_orders", []) or [])
+    ]
+
+
+def training_orders_from_list(arr: list):
+    return [training_order_from_dict(d) for d in (arr or [])]
 
 
 # -------------------------------------------------------------------
@@ -352,10 +358,21 @@ def training_orders_from_list(arr: list):
 # -------------------------------------------------------------------
 
 
+# Kända fält per stats-klass i deklarationsordning (beräknas en gång, inte per
+# sparning/laddning); mängderna används för snabb nyckelkontroll vid laddning
+_PLAYER_STATS_FIELDS = tuple(f.name for f in fields(stats_mod.PlayerSeasonStats))
+_CLUB_STATS_FIELDS = tuple(f.name for f in fields(stats_mod.ClubSeasonStats))
+_PLAYER_STATS_KEYS = frozenset(_PLAYER_STATS_FIELDS)
+_CLUB_STATS_KEYS = frozenset(_CLUB_STATS_FIELDS)
+
+
 def player_stats_to_dict_map(pmap: Dict[int, Any]) -> Dict[str, Any]:
     out: Dict[str, Any] = {}
     for pid, s in (pmap or {}).items():
-        if hasattr(s, "__dict__"):
+        if is_dataclass(s):
+            # slots-dataklasser saknar __dict__ → läs fälten explicit
+            d = {f: getattr(s, f) for f in _PLAYER_STATS_FIELDS}
+        elif hasattr(s, "__dict__"):
             d = dict(s.__dict__)
         else:
             d = {
@@ -374,23 +391,34 @@ def player_stats_to_dict_map(pmap: Dict[int, Any]) -> Dict[str, Any]:
     return out
 
 
+def _known_fields(v: Dict[str, Any], allowed: frozenset) -> Dict[str, Any]:
+    # Äldre sparfiler kan ha extra nycklar (t.ex. rating_avg) → bara kända fält.
+    # Vanliga fallet (inga extra nycklar) klaras med en mängdjämförelse.
+    if v.keys() <= allowed:
+        return v
+    return {key: val for key, val in v.items() if key in allowed}
+
+
 def player_stats_from_dict_map(d: Dict[str, Any]) -> Dict[int, Any]:
     out: Dict[int, Any] = {}
+    cls = stats_mod.PlayerSeasonStats
     for k, v in (d or {}).items():
         pid = int(k)
-        if hasattr(stats_mod, "PlayerStats"):
-            cls = getattr(stats_mod, "PlayerStats")
-            obj = cls(**v)
+        if isinstance(v, dict):
+            s = cls(**_known_fields(v, _PLAYER_STATS_KEYS))
+            s.club_name = intern(s.club_name)
+            out[pid] = s
         else:
-            obj = v
-        out[pid] = obj
+            out[pid] = v
     return out
 
 
 def club_stats_to_dict_map(cmap: Dict[str, Any]) -> Dict[str, Any]:
     out: Dict[str, Any] = {}
     for name, s in (cmap or {}).items():
-        if hasattr(s, "__dict__"):
+        if is_dataclass(s):
+            d = {f: getattr(s, f) for f in _CLUB_STATS_FIELDS}
+        elif hasattr(s, "__dict__"):
             d = dict(s.__dict__)
         else:
             d = {
@@ -412,40 +440,72 @@ def club_stats_to_dict_map(cmap: Dict[str, Any]) -> Dict[str, Any]:
 
 def club_stats_from_dict_map(d: Dict[str, Any]) -> Dict[str, Any]:
     out: Dict[str, Any] = {}
+    cls = stats_mod.ClubSeasonStats
     for name, v in (d or {}).items():
-        if hasattr(stats_mod, "ClubStats"):
-            cls = getattr(stats_mod, "ClubStats")
-            obj = cls(**v)
+        name = intern(name)
+        if isinstance(v, dict):
+            s = cls(**_known_fields(v, _CLUB_STATS_KEYS))
+            s.club_name = intern(s.club_name)
+            out[name] = s
         else:
-            obj = v
-        out[name] = obj
+            out[name] = v
     return out
 
 
+def table_snapshot_from_dict(d: Dict[str, Any]) -> Dict[str, Any]:
+    return {intern(name): row for name, row in (d or {}).items()}
+
+
 def match_log_to_dict_list(log: List[Any]) -> List[Dict[str, Any]]:
     out: List[Dict[str, Any]] = []
     for mr in log or []:
-        if hasattr(mr, "__dict__"):
-            d = dict(mr.__dict__)
-        else:
-            d = {
+        if isinstance(mr, dict):
+            out.append(mr)
+            continue
+        out.append(
+            {
                 "competition": getattr(mr, "competition", "league"),
                 "round": getattr(mr, "round", 0),
                 "home": getattr(mr, "home", ""),
                 "away": getattr(mr, "away", ""),
                 "home_goals": getattr(mr, "home_goals", 0),
                 "away_goals": getattr(mr, "away_goals", 0),
+                # händelser kolumnvis (se MatchRecord)
+                "event_types": list(getattr(mr, "event_types", []) or []),
+                "event_minutes": list(getattr(mr, "event_minutes", []) or []),
+                "event_player_ids": list(getattr(mr, "event_player_ids", []) or []),
+                "event_assist_ids": list(getattr(mr, "event_assist_ids", []) or []),
+                "ratings": dict(getattr(mr, "ratings", {}) or {}),
             }
-        out.append(d)
+        )
     return out
 
 
+def _match_record_columns(d: Dict[str, Any]) -> Dict[str, Any]:
+    """Äldre sparfiler har 'events' som lista av dicts → gör om till kolumner."""
+    d = dict(d)
+    events = d.pop("events", None)
+    if events and "event_types" not in d:
+        d["event_types"] = [e.get("type") for e in events]
+        d["event_minutes"] = [e.get("minute") for e in events]
+        d["event_player_ids"] = [e.get("player_id") for e in events]
+        d["event_assist_ids"] = [e.get("assist_id") for e in events]
+    if "ratings" in d:
+        d["ratings"] = {int(k): float(v) for k, v in (d["ratings"] or {}).items()}
+    # Samma namn återkommer i varje post → en delad sträng per klubb
+    if "home" in d:
+        d["home"] = intern(d["home"])
+    if "away" in d:
+        d["away"] = intern(d["away"])
+    return d
+
+
 def match_log_from_dict_list(arr: List[Dict[str, Any]]) -> List[Any]:
     out: List[Any] = []
     if hasattr(stats_mod, "MatchRecord"):
         cls = getattr(stats_mod, "MatchRecord")
         for d in arr or []:
-            out.append(cls(**d))
+            out.append(cls(**_match_record_columns(d)))
     else:
         out = arr or []
     return out
@@ -465,11 +525,13 @@ def game_state_to_dict(gs) -> Dict[str, Any]:
         ),
         "current_round": int(getattr(gs, "current_round", 1)),
         "cup_state": cup_state_to_dict(getattr(gs, "cup_state", None)),
-        "table_snapshot": getattr(gs, "table_snapshot", {}) or {},
+        "table_snapshot": dict(getattr(gs, "table_snapshot", {}) or {}),
         "player_stats": player_stats_to_dict_map(getattr(gs, "player_stats", {}) or {}),
         "club_stats": club_stats_to_dict_map(getattr(gs, "club_stats", {}) or {}),
         "match_log": match_log_to_dict_list(getattr(gs, "match_log", []) or []),
         "training_orders": training_orders_to_list(gs),  # <-- NYTT
+        # Cupräknaren sparas så att load slipper skanna hela matchloggen
+        "max_cup_round": int(getattr(gs, "max_cup_round", 0)),
     }
     hist = getattr(gs, "history", None)
     if hist is not None:
@@ -501,11 +563,10 @@ def game_state_from_dict(d: Dict[str, Any]):
         history=history,
         cup_state=None,
     )
-    gs.ensure_containers()
 
     # återställ övrigt
     gs.cup_state = cup_state_from_dict(d.get("cup_state"), league)
-    gs.table_snapshot = d.get("table_snapshot") or {}
+    gs.table_snapshot = table_snapshot_from_dict(d.get("table_snapshot"))
     gs.player_stats = player_stats_from_dict_map(d.get("player_stats", {}))
     gs.club_stats = club_stats_from_dict_map(d.get("club_stats", {}))
     gs.match_log = match_log_from_dict_list(d.get("match_log", []))
@@ -513,6 +574,8 @@ def game_state_from_dict(d: Dict[str, Any]):
         d.get("training_orders", [])
     )  # <-- NYTT
 
+    # Sist: index, rondräknare och snapshot-typ byggs från det återställda
+    gs.ensure_containers()
     return gs
 
 
@@ -526,12 +589,29 @@ deserialize_game_state = game_state_from_dict
 # -------------------------------------------------------------------
 
 
+def dumps_json(data: Any) -> bytes:
+    """JSON (UTF-8, indent 2) som bytes; orjson om det finns, annars stdlib."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def loads_json(raw: bytes) -> Any:
+    """Parsa JSON-bytes; orjson om det finns, annars (eller vid NaN o.d.) stdlib."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # t.ex. NaN/Infinity från en stdlib-skriven fil
+    return json.loads(raw)
+
+
 def dump_game_state(gs, path: str) -> None:
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(game_state_to_dict(gs), f, ensure_ascii=False, indent=2)
+    with open(path, "wb") as f:
+        f.write(dumps_json(game_state_to_dict(gs)))
 
 
 def load_game_state(path: str):
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    with open(path, "rb") as f:
+        data = loads_json(f.read())
     return game_state_from_dict(data)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import random
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Tuple
 
 from .club import Club
 from .match import EventType, MatchResult, PlayerEvent
@@ -35,32 +35,42 @@ def _ensure_row(table: Dict[str, TableRow], club: Club) -> TableRow:
     return table[key]
 
 
+# Fältordning för result_tallies (samma namn som i TableRow och table_snapshot)
+TALLY_FIELDS = ("mp", "w", "d", "losses", "gf", "ga", "pts")
+
+
+def result_tallies(hg: int, ag: int) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """Radökningar i TALLY_FIELDS-ordning för hemma- resp. bortalaget."""
+    if hg > ag:
+        return (1, 1, 0, 0, hg, ag, 3), (1, 0, 0, 1, ag, hg, 0)
+    if hg < ag:
+        return (1, 0, 0, 1, hg, ag, 0), (1, 1, 0, 0, ag, hg, 3)
+    return (1, 0, 1, 0, hg, ag, 1), (1, 0, 1, 0, ag, hg, 1)
+
+
+def _add_tally(row: TableRow, t: Tuple[int, ...]) -> None:
+    mp, w, d, losses, gf, ga, pts = t
+    row.mp += mp
+    row.w += w
+    row.d += d
+    row.losses += losses
+    row.gf += gf
+    row.ga += ga
+    row.pts += pts
+
+
 def apply_result_to_table(table: Dict[str, TableRow], res: MatchResult) -> None:
-    h = _ensure_row(table, res.home)
-    a = _ensure_row(table, res.away)
-
-    h.mp += 1
-    a.mp += 1
-
-    h.gf += res.home_stats.goals
-    h.ga += res.away_stats.goals
-
-    a.gf += res.away_stats.goals
-    a.ga += res.home_stats.goals
-
-    if res.home_stats.goals > res.away_stats.goals:
-        h.w += 1
-        a.losses += 1
-        h.pts += 3
-    elif res.home_stats.goals < res.away_stats.goals:
-        a.w += 1
-        h.losses += 1
-        a.pts += 3
-    else:
-        h.d += 1
-        a.d += 1
-        h.pts += 1
-        a.pts += 1
+    apply_results_to_table(table, (res,))
+
+
+def apply_results_to_table(
+    table: Dict[str, TableRow], results: Iterable[MatchResult]
+) -> None:
+    """Som apply_result_to_table för flera resultat (t.ex. en hel omgång)."""
+    for res in results:
+        th, ta = result_tallies(res.home_stats.goals, res.away_stats.goals)
+        _add_tally(_ensure_row(table, res.home), th)
+        _add_tally(_ensure_row(table, res.away), ta)
 
 
 def sort_table(table: Dict[str, TableRow]) -> List[TableRow]:
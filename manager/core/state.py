@@ -1,18 +1,30 @@
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass, field
+import os
+import pickle
+from collections import defaultdict
+from dataclasses import MISSING, dataclass, field, fields
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from .club import Club
 from .fixtures import Match
 from .history import HistoryStore
-from .league import League
+from .league import League, LeagueRules
+from .player import Player
 
 # serialize.py som källa
 from .serialize import (
+    club_stats_from_dict_map,
+    cup_state_from_dict,
+    dumps_json,
     fixtures_from_dict,
     league_from_dict,
+    loads_json,
+    match_log_from_dict_list,
+    player_stats_from_dict_map,
+    table_snapshot_from_dict,
+    training_orders_from_list,
 )
 from .serialize import (
     game_state_from_dict as deserialize_game_state,
@@ -21,6 +33,67 @@ from .serialize import (
     game_state_to_dict as serialize_game_state,
 )
 
+# Pickle-protokoll ≥ 2 börjar alltid med PROTO-opkoden; JSON börjar med "{"
+_PICKLE_MAGIC = b"\x80"
+_PICKLE_SUFFIX = ".pkl"
+
+# Sektioner i sparfilen som load_partial kan välja bland
+SAVE_SECTIONS = frozenset(
+    {
+        "league",
+        "fixtures_by_division",
+        "cup_state",
+        "table_snapshot",
+        "player_stats",
+        "club_stats",
+        "match_log",
+        "training_orders",
+        "history",
+    }
+)
+
+# Sektioner vars storlek section_size kan ge utan att de materialiseras
+_COUNTED_SECTIONS = ("player_stats", "club_stats", "match_log", "training_orders")
+
+
+def _read_save(path: str | Path) -> Any:
+    """
+    Rått innehåll i en sparfil: GameState (pickle) eller dict (JSON).
+    Bara `.pkl`-filer avpicklas (pickle kan köra godtycklig kod); pickle-data
+    under något annat filnamn vägras.
+    """
+    p = Path(path)
+    raw = p.read_bytes()
+    if p.suffix == _PICKLE_SUFFIX:
+        data = pickle.loads(raw)
+        if not isinstance(data, GameState):
+            raise ValueError(f"{p} innehåller inget sparat GameState.")
+        return data
+    if raw[:1] == _PICKLE_MAGIC:
+        raise ValueError(
+            f"{p} innehåller pickle-data men heter inte *{_PICKLE_SUFFIX}; "
+            "filen läses inte."
+        )
+    return loads_json(raw)
+
+
+# Cacher på GameState som byggs om vid inläsning och därför inte sparas
+_DERIVED_FIELDS = frozenset(
+    {
+        "club_index",
+        "player_index",
+        "active_training",
+        "schedule_rounds",
+        "partial",
+        "section_sizes",
+    }
+)
+
+
+def new_table_row() -> Dict[str, int]:
+    """Tom tabellrad i table_snapshot."""
+    return {"mp": 0, "w": 0, "d": 0, "losses": 0, "gf": 0, "ga": 0, "pts": 0}
+
 
 @dataclass(slots=True)
 class GameState:
@@ -40,9 +113,120 @@ class GameState:
     # NYTT: träningsordrar
     training_orders: List[Any] = field(default_factory=list)
 
-    def ensure_containers(self) -> None:
-        if self.table_snapshot is None:
-            self.table_snapshot = {}
+    # Uppslagsindex (byggs i ensure_containers, sparas inte).
+    # Nycklar är gemena klubbnamn; spelare nycklas per klubb eftersom id krockar.
+    club_index: Dict[str, Club] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    player_index: Dict[Tuple[str, int], Player] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    # Aktiva träningsordrar per (klubbnamn, spelar-id) (byggs i ensure_containers,
+    # hålls i synk av training.start_form_training/advance_week)
+    active_training: Dict[Tuple[str, int], Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    # Högsta cuprunda som loggats i match_log (sparas i sparfilen; äldre filer
+    # utan den skannas i ensure_containers; record_matches uppdaterar)
+    max_cup_round: int = field(default=0, init=False, repr=False, compare=False)
+
+    # Sista schemalagda rond per division: namn → (fixturelista, rond). Listans
+    # identitet avgör giltigheten, så ett nytt schema (ny säsong) räknas om.
+    schedule_rounds: Dict[str, Tuple[List[Match], int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    # Sant för tillstånd från load_partial (alla sektioner är inte inlästa)
+    partial: bool = field(default=False, init=False, repr=False, compare=False)
+    section_sizes: Dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Härledda cacher följer inte med i pickle-filen; de byggs om vid load
+        return {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if f.name not in _DERIVED_FIELDS
+        }
+
+    def __setstate__(self, state: Any) -> None:
+        if isinstance(state, tuple):  # äldre pickle: (None, {slot: värde})
+            state = state[1]
+        for f in fields(self):
+            if f.name in state:
+                setattr(self, f.name, state[f.name])
+            elif f.default_factory is not MISSING:
+                setattr(self, f.name, f.default_factory())
+            else:
+                setattr(self, f.name, f.default)
+
+    def section_size(self, name: str) -> int:
+        """Antal poster i en sektion, även om load_partial hoppade över den."""
+        size = self.section_sizes.get(name)
+        if size is not None:
+            return size
+        return len(getattr(self, name) or ())
+
+    def record_matches(self, records: List[Any]) -> None:
+        """Lägg till en omgångs MatchRecords i match_log (och max_cup_round)."""
+        self.match_log.extend(records)
+        for mr in records:
+            if mr.competition == "cup" and mr.round > self.max_cup_round:
+                self.max_cup_round = mr.round
+
+    def _rebuild_round_counters(self) -> None:
+        self.max_cup_round = max(
+            (mr.round for mr in self.match_log if mr.competition == "cup"),
+            default=0,
+        )
+
+    def last_scheduled_round(self, div_name: str) -> int:
+        """Högsta rondnumret i divisionens ligaschema (1 om schemat är tomt)."""
+        fixtures = self.fixtures_by_division.get(div_name) or []
+        cached = self.schedule_rounds.get(div_name)
+        if cached is not None and cached[0] is fixtures:
+            return cached[1]
+        last = max((m.round for m in fixtures), default=1)
+        self.schedule_rounds[div_name] = (fixtures, last)
+        return last
+
+    def rebuild_indexes(self) -> None:
+        clubs: Dict[str, Club] = {}
+        players: Dict[Tuple[str, int], Player] = {}
+        for div in getattr(self.league, "divisions", None) or []:
+            for c in div.clubs:
+                key = c.name.lower()
+                clubs[key] = c
+                for p in c.players:
+                    players[(key, p.id)] = p
+        self.club_index = clubs
+        self.player_index = players
+
+    def find_club(self, name: str) -> Optional[Club]:
+        """Klubb via namn (skiftlägesokänsligt). Vid miss byggs indexet om."""
+        key = name.lower()
+        club = self.club_index.get(key)
+        if club is None:
+            self.rebuild_indexes()
+            club = self.club_index.get(key)
+        return club
+
+    def find_player(self, club_name: str, player_id: int) -> Optional[Player]:
+        """Spelare via (klubbnamn, id). Vid miss byggs indexet om."""
+        key = (club_name.lower(), player_id)
+        player = self.player_index.get(key)
+        if player is None:
+            self.rebuild_indexes()
+            player = self.player_index.get(key)
+        return player
+
+    def ensure_containers(self, *, round_counters: bool = True) -> None:
+        if not isinstance(self.table_snapshot, defaultdict):
+            # defaultdict → en rad-dict per klubb, ingen allokering per match
+            self.table_snapshot = defaultdict(new_table_row, self.table_snapshot or {})
         if self.player_stats is None:
             self.player_stats = {}
         if self.club_stats is None:
@@ -53,41 +237,115 @@ class GameState:
             self.training_orders = []
         if self.history is None:
             self.history = HistoryStore()
+        self.rebuild_indexes()
+        if round_counters:
+            self._rebuild_round_counters()
+        self.active_training = {
+            (o.club_name, o.player_id): o
+            for o in self.training_orders
+            if o.status == "active"
+        }
 
     def save(self, path: str | Path) -> None:
+        """Spara som JSON, eller som pickle om filen slutar på `.pkl`."""
+        if self.partial:
+            raise ValueError("Ett partiellt laddat GameState kan inte sparas.")
         p = Path(path)
         p.parent.mkdir(parents=True, exist_ok=True)
-        with p.open("w", encoding="utf-8") as f:
-            json.dump(serialize_game_state(self), f, ensure_ascii=False, indent=2)
+        if p.suffix == _PICKLE_SUFFIX:
+            data = pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
+        else:
+            data = dumps_json(serialize_game_state(self))
+        # Skriv till en temporär fil och byt sedan atomärt, så att en krasch
+        # mitt i skrivningen aldrig lämnar en halv sparfil efter sig
+        tmp = p.with_name(p.name + ".tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, p)
 
     @classmethod
     def load(cls, path: str | Path) -> "GameState":
-        p = Path(path)
-        with p.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        """Läs en sparfil: pickle för `.pkl`, annars JSON."""
+        data = _read_save(path)
+        if isinstance(data, GameState):
+            # Rondräknarna följer med i pickle-filen → ingen omskanning
+            data.ensure_containers(round_counters=False)
+            return data
         return cls.from_dict(data)
 
+    @classmethod
+    def load_partial(cls, path: str | Path, keys: Iterable[str]) -> "GameState":
+        """
+        Läs bara sektionerna i `keys` (se SAVE_SECTIONS) för läskommandon.
+        Övriga sektioner lämnas tomma och tillståndet markeras som partiellt,
+        så save() vägrar skriva över sparfilen med det. Pickle-filer och äldre
+        JSON-format läses fullt.
+        """
+        data = _read_save(path)
+        if isinstance(data, GameState):
+            # Rondräknarna följer med i pickle-filen → ingen omskanning
+            data.ensure_containers(round_counters=False)
+            return data
+        if "fixtures_by_division" not in data:
+            return cls.from_dict(data)
+        keys = frozenset(keys)
+        gs = cls._from_sections(data, keys)
+        gs.partial = True
+        # Antal poster i överhoppade sektioner (listan/dicten är redan parsad)
+        gs.section_sizes = {
+            name: len(data.get(name) or ())
+            for name in _COUNTED_SECTIONS
+            if name not in keys
+        }
+        return gs
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "GameState":
         if "fixtures_by_division" in data:
+            return cls._from_sections(data, SAVE_SECTIONS)
+        return deserialize_game_state(data)
+
+    @classmethod
+    def _from_sections(cls, data: Dict[str, Any], keys: frozenset) -> "GameState":
+        # Ligan behövs även för att koppla fixtures och cupens klubbar
+        if keys & {"league", "fixtures_by_division", "cup_state"}:
             league = league_from_dict(data["league"])
-            fixtures = fixtures_from_dict(data["fixtures_by_division"], league)
-            gs = cls(
-                season=int(data.get("season", 1)),
-                league=league,
-                fixtures_by_division=fixtures,
-                current_round=int(data.get("current_round", 1)),
-                history=HistoryStore(),
-                cup_state=None,
+        else:
+            league = League(name=data["league"].get("name", ""), rules=LeagueRules())
+        gs = cls(
+            season=int(data.get("season", 1)),
+            league=league,
+            fixtures_by_division=(
+                fixtures_from_dict(data["fixtures_by_division"], league)
+                if "fixtures_by_division" in keys
+                else {}
+            ),
+            current_round=int(data.get("current_round", 1)),
+            history=(
+                HistoryStore.from_dict(data.get("history") or {})
+                if "history" in keys
+                else HistoryStore()
+            ),
+            cup_state=None,
+        )
+        if "cup_state" in keys:
+            gs.cup_state = cup_state_from_dict(data.get("cup_state"), league)
+        if "table_snapshot" in keys:
+            gs.table_snapshot = table_snapshot_from_dict(data.get("table_snapshot"))
+        if "player_stats" in keys:
+            gs.player_stats = player_stats_from_dict_map(data.get("player_stats", {}))
+        if "club_stats" in keys:
+            gs.club_stats = club_stats_from_dict_map(data.get("club_stats", {}))
+        if "match_log" in keys:
+            gs.match_log = match_log_from_dict_list(data.get("match_log", []) or [])
+        if "training_orders" in keys:
+            gs.training_orders = training_orders_from_list(
+                data.get("training_orders", [])
             )
-            gs.table_snapshot = data.get("table_snapshot", {}) or {}
-            gs.player_stats = data.get("player_stats", {}) or {}
-            gs.club_stats = data.get("club_stats", {}) or {}
-            gs.match_log = data.get("match_log", []) or []
-            gs.training_orders = data.get("training_orders", []) or []
-            gs.ensure_containers()
-            return gs
-        return deserialize_game_state(data)
+        cup_round = data.get("max_cup_round")
+        gs.ensure_containers(round_counters=cup_round is None)
+        if cup_round is not None:
+            gs.max_cup_round = int(cup_round)
+        return gs
 
     def to_dict(self) -> Dict[str, Any]:
         return serialize_game_state(self)
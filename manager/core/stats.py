@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Dict, List
+from dataclasses import dataclass, field, fields
+from math import ceil
+from typing import Callable, Dict, List, Optional, Tuple
 
 from .match import EventType, MatchResult, PlayerEvent
 from .player import Player
@@ -69,9 +70,26 @@ class MatchRecord:
     away: str
     home_goals: int
     away_goals: int
-    events: List[dict]  # [{type, minute, player_id, assist_id}]
+    # Händelser lagras kolumnvis: en lista per fält, samma index = samma händelse
+    event_types: List[str] = field(default_factory=list)
+    event_minutes: List[int] = field(default_factory=list)
+    event_player_ids: List[Optional[int]] = field(default_factory=list)
+    event_assist_ids: List[Optional[int]] = field(default_factory=list)
     ratings: Dict[int, float] = field(default_factory=dict)  # player.id -> rating
 
+    @property
+    def events(self) -> List[dict]:
+        """Bakåtkompatibel vy: [{type, minute, player_id, assist_id}] (byggs vid behov)."""
+        return [
+            {"type": t, "minute": m, "player_id": pid, "assist_id": aid}
+            for t, m, pid, aid in zip(
+                self.event_types,
+                self.event_minutes,
+                self.event_player_ids,
+                self.event_assist_ids,
+            )
+        ]
+
 
 # -------- Hjälpare --------
 
@@ -94,9 +112,86 @@ def _count_events(events: List[PlayerEvent], pred) -> int:
     return sum(1 for ev in events if pred(ev))
 
 
+# -------- Händelse-hanterare (index = EventType.value) --------
+
+_Stats = Dict[int, PlayerSeasonStats]
+_ClubOf = Callable[[Player], str]
+
+
+def _on_goal(stats: _Stats, ev: PlayerEvent, club_of: _ClubOf) -> None:
+    _ensure_ps(stats, ev.player, club_of(ev.player)).goals += 1
+    if ev.assist_by is not None:
+        _ensure_ps(stats, ev.assist_by, club_of(ev.assist_by)).assists += 1
+
+
+def _on_shot_on(stats: _Stats, ev: PlayerEvent, club_of: _ClubOf) -> None:
+    s = _ensure_ps(stats, ev.player, club_of(ev.player))
+    s.shots += 1
+    s.shots_on += 1
+
+
+def _on_shot_off(stats: _Stats, ev: PlayerEvent, club_of: _ClubOf) -> None:
+    _ensure_ps(stats, ev.player, club_of(ev.player)).shots += 1
+
+
+def _on_penalty_scored(stats: _Stats, ev: PlayerEvent, club_of: _ClubOf) -> None:
+    _ensure_ps(stats, ev.player, club_of(ev.player)).penalties_scored += 1
+
+
+def _on_penalty_missed(stats: _Stats, ev: PlayerEvent, club_of: _ClubOf) -> None:
+    _ensure_ps(stats, ev.player, club_of(ev.player)).penalties_missed += 1
+
+
+def _on_offside(stats: _Stats, ev: PlayerEvent, club_of: _ClubOf) -> None:
+    _ensure_ps(stats, ev.player, club_of(ev.player)).offsides += 1
+
+
+def _on_yellow(stats: _Stats, ev: PlayerEvent, club_of: _ClubOf) -> None:
+    _ensure_ps(stats, ev.player, club_of(ev.player)).yellows += 1
+
+
+def _on_red(stats: _Stats, ev: PlayerEvent, club_of: _ClubOf) -> None:
+    _ensure_ps(stats, ev.player, club_of(ev.player)).reds += 1
+
+
+def _on_injury(stats: _Stats, ev: PlayerEvent, club_of: _ClubOf) -> None:
+    _ensure_ps(stats, ev.player, club_of(ev.player)).injuries += 1
+
+
+# Platt lista indexerad med EventType.value (None = händelsen påverkar inte stats)
+_EVENT_HANDLERS: List[Optional[Callable[[_Stats, PlayerEvent, _ClubOf], None]]] = [
+    None
+] * (max(et.value for et in EventType) + 1)
+for _et, _handler in (
+    (EventType.GOAL, _on_goal),
+    (EventType.SHOT_ON, _on_shot_on),
+    (EventType.SHOT_OFF, _on_shot_off),
+    (EventType.PENALTY_SCORED, _on_penalty_scored),
+    (EventType.PENALTY_MISSED, _on_penalty_missed),
+    (EventType.OFFSIDE, _on_offside),
+    (EventType.YELLOW, _on_yellow),
+    (EventType.RED, _on_red),
+    (EventType.INJURY, _on_injury),
+):
+    _EVENT_HANDLERS[_et.value] = _handler
+
+
 # -------- Uppdatera stats från en match --------
 
 
+def _apply_appearances(
+    player_stats: Dict[int, PlayerSeasonStats],
+    roster: List[Player],
+    club: str,
+    minutes: int = 90,
+) -> None:
+    """Ger varje spelare i elvan ett framträdande och `minutes` spelade minuter."""
+    for p in roster:
+        ps = _ensure_ps(player_stats, p, club)
+        ps.appearances += 1
+        ps.minutes += minutes
+
+
 def update_stats_from_result(
     result: MatchResult,
     *,
@@ -104,87 +199,79 @@ def update_stats_from_result(
     round_no: int,
     player_stats: Dict[int, PlayerSeasonStats],
     club_stats: Dict[str, ClubSeasonStats],
+    copy_ratings: bool = False,
 ) -> MatchRecord:
+    """
+    Uppdaterar säsongsstatistik från en match och returnerar en MatchRecord.
+    MatchRecord.ratings delar dict med result.ratings om inte copy_ratings=True;
+    skicka True om du tänker ändra i result efteråt.
+    """
     hname = result.home.name
     aname = result.away.name
 
     # Lagstatistik
+    hs = result.home_stats
+    as_ = result.away_stats
+    hg = hs.goals
+    ag = as_.goals
     hcs = _ensure_cs(club_stats, hname)
     acs = _ensure_cs(club_stats, aname)
 
     hcs.played += 1
+    hcs.goals_for += hg
+    hcs.goals_against += ag
     acs.played += 1
-    hcs.goals_for += result.home_stats.goals
-    hcs.goals_against += result.away_stats.goals
-    acs.goals_for += result.away_stats.goals
-    acs.goals_against += result.home_stats.goals
+    acs.goals_for += ag
+    acs.goals_against += hg
 
     # seger/oavgjort/förlust
-    if result.home_stats.goals > result.away_stats.goals:
+    if hg > ag:
         hcs.wins += 1
         acs.losses += 1
-    elif result.home_stats.goals < result.away_stats.goals:
+    elif hg < ag:
         acs.wins += 1
         hcs.losses += 1
     else:
         hcs.draws += 1
         acs.draws += 1
 
-    # lagaggregat från matchstats
-    for cs, ts in ((hcs, result.home_stats), (acs, result.away_stats)):
-        cs.shots += ts.shots
-        cs.shots_on += ts.shots_on
-        cs.corners += ts.corners
-        cs.offsides += ts.offsides
-        cs.fouls += ts.fouls
-        cs.saves += ts.saves
-    if result.away_stats.goals == 0:
+    # lagaggregat från matchstats (rak kod, ingen tupel per match)
+    hcs.shots += hs.shots
+    hcs.shots_on += hs.shots_on
+    hcs.corners += hs.corners
+    hcs.offsides += hs.offsides
+    hcs.fouls += hs.fouls
+    hcs.saves += hs.saves
+    acs.shots += as_.shots
+    acs.shots_on += as_.shots_on
+    acs.corners += as_.corners
+    acs.offsides += as_.offsides
+    acs.fouls += as_.fouls
+    acs.saves += as_.saves
+    if ag == 0:
         hcs.clean_sheets += 1
-    if result.home_stats.goals == 0:
+    if hg == 0:
         acs.clean_sheets += 1
 
     # spelare: 90 min / appearance
-    for p in result.home.players:
-        ps = _ensure_ps(player_stats, p, hname)
-        ps.appearances += 1
-        ps.minutes += 90
-    for p in result.away.players:
-        ps = _ensure_ps(player_stats, p, aname)
-        ps.appearances += 1
-        ps.minutes += 90
+    _apply_appearances(player_stats, result.home.players, hname)
+    _apply_appearances(player_stats, result.away.players, aname)
+
+    # Hjälpare för klubbnamn utifrån elvorna i resultatet. Spelar-id krockar
+    # mellan klubbar, så hemmaelvan slås upp på objektidentitet.
+    home_ids = {id(p) for p in result.home.players}
 
-    # Hjälpare för klubbnamn utifrån elvorna i resultatet
     def _club_of(player: Player) -> str:
-        return hname if player in result.home.players else aname
+        return hname if id(player) in home_ids else aname
 
-    # spelarevents
+    # spelarevents (hanterare slås upp på heltalsvärdet)
+    handlers = _EVENT_HANDLERS
     for ev in result.events:
-        p = ev.player
-        if ev.event is EventType.GOAL and p is not None:
-            _ensure_ps(player_stats, p, _club_of(p)).goals += 1
-            if ev.assist_by is not None:
-                _ensure_ps(
-                    player_stats, ev.assist_by, _club_of(ev.assist_by)
-                ).assists += 1
-        elif ev.event is EventType.SHOT_ON and p is not None:
-            s = _ensure_ps(player_stats, p, _club_of(p))
-            s.shots += 1
-            s.shots_on += 1
-        elif ev.event is EventType.SHOT_OFF and p is not None:
-            s = _ensure_ps(player_stats, p, _club_of(p))
-            s.shots += 1
-        elif ev.event is EventType.PENALTY_SCORED and p is not None:
-            _ensure_ps(player_stats, p, _club_of(p)).penalties_scored += 1
-        elif ev.event is EventType.PENALTY_MISSED and p is not None:
-            _ensure_ps(player_stats, p, _club_of(p)).penalties_missed += 1
-        elif ev.event is EventType.OFFSIDE and p is not None:
-            _ensure_ps(player_stats, p, _club_of(p)).offsides += 1
-        elif ev.event is EventType.YELLOW and p is not None:
-            _ensure_ps(player_stats, p, _club_of(p)).yellows += 1
-        elif ev.event is EventType.RED and p is not None:
-            _ensure_ps(player_stats, p, _club_of(p)).reds += 1
-        elif ev.event is EventType.INJURY and p is not None:
-            _ensure_ps(player_stats, p, _club_of(p)).injuries += 1
+        if ev.player is None:
+            continue
+        handler = handlers[ev.event.value]
+        if handler is not None:
+            handler(player_stats, ev, _club_of)
 
     # betyg → summera
     for p in result.home.players + result.away.players:
@@ -194,27 +281,118 @@ def update_stats_from_result(
             ps.rating_sum += r
             ps.rating_count += 1
 
-    # MatchRecord (serialiserbar)
-    rec_events: List[dict] = []
-    for ev in result.events:
-        rec_events.append(
-            {
-                "type": ev.event.name,
-                "minute": getattr(ev, "minute", None),
-                "player_id": (ev.player.id if ev.player else None),
-                "assist_id": (
-                    ev.assist_by.id if getattr(ev, "assist_by", None) else None
-                ),
-            }
-        )
+    # MatchRecord (serialiserbar) – händelserna kolumnvis
+    n = len(result.events)
+    ev_types: List[str] = [""] * n
+    ev_minutes: List[int] = [0] * n
+    ev_player_ids: List[Optional[int]] = [None] * n
+    ev_assist_ids: List[Optional[int]] = [None] * n
+    for i, ev in enumerate(result.events):
+        # PlayerEvent har alltid minute/player/assist_by → direkt åtkomst
+        player = ev.player
+        assist = ev.assist_by
+        ev_types[i] = ev.event.name
+        ev_minutes[i] = ev.minute
+        if player is not None:
+            ev_player_ids[i] = player.id
+        if assist is not None:
+            ev_assist_ids[i] = assist.id
 
     return MatchRecord(
         competition=competition,
         round=round_no,
         home=hname,
         away=aname,
-        home_goals=result.home_stats.goals,
-        away_goals=result.away_stats.goals,
-        events=rec_events,
-        ratings=result.ratings.copy(),
+        home_goals=hg,
+        away_goals=ag,
+        event_types=ev_types,
+        event_minutes=ev_minutes,
+        event_player_ids=ev_player_ids,
+        event_assist_ids=ev_assist_ids,
+        ratings=(result.ratings.copy() if copy_ratings else result.ratings),
     )
+
+
+# -------- Flera matcher (parallellt) --------
+
+# Räknarfält som summeras när delresultat slås ihop (allt utom nycklar/namn)
+_PLAYER_COUNTERS = tuple(
+    f.name
+    for f in fields(PlayerSeasonStats)
+    if f.name not in ("player_id", "club_name")
+)
+_CLUB_COUNTERS = tuple(f.name for f in fields(ClubSeasonStats) if f.name != "club_name")
+
+
+def _merge_counters(dst: Dict, src: Dict, counters: Tuple[str, ...]) -> None:
+    for key, part in src.items():
+        target = dst.get(key)
+        if target is None:
+            dst[key] = part
+            continue
+        for name in counters:
+            setattr(target, name, getattr(target, name) + getattr(part, name))
+
+
+def _stats_worker(
+    job: Tuple[List[MatchResult], str, int],
+) -> Tuple[List[MatchRecord], Dict[int, PlayerSeasonStats], Dict[str, ClubSeasonStats]]:
+    results, competition, round_no = job
+    player_stats: Dict[int, PlayerSeasonStats] = {}
+    club_stats: Dict[str, ClubSeasonStats] = {}
+    records = [
+        update_stats_from_result(
+            res,
+            competition=competition,
+            round_no=round_no,
+            player_stats=player_stats,
+            club_stats=club_stats,
+        )
+        for res in results
+    ]
+    return records, player_stats, club_stats
+
+
+def update_stats_from_results_batch(
+    results: List[MatchResult],
+    *,
+    competition: str,
+    round_no: int,
+    player_stats: Dict[int, PlayerSeasonStats],
+    club_stats: Dict[str, ClubSeasonStats],
+    workers: int = 1,
+) -> List[MatchRecord]:
+    """
+    Som update_stats_from_result men för en hel omgång.
+    Med workers > 1 delas matcherna upp i sammanhängande block som räknas i
+    separata processer; delresultaten summeras sedan in i player_stats/club_stats.
+    MatchRecords returneras i samma ordning som results.
+    """
+    if workers <= 1 or len(results) < 2:
+        return [
+            update_stats_from_result(
+                res,
+                competition=competition,
+                round_no=round_no,
+                player_stats=player_stats,
+                club_stats=club_stats,
+            )
+            for res in results
+        ]
+
+    n = min(workers, len(results))
+    size = ceil(len(results) / n)
+    jobs = [
+        (results[i : i + size], competition, round_no)
+        for i in range(0, len(results), size)
+    ]
+    # Importeras här: processpoolen kostar märkbart vid uppstart och behövs sällan
+    from concurrent.futures import ProcessPoolExecutor
+
+    records: List[MatchRecord] = []
+    with ProcessPoolExecutor(max_workers=n) as pool:
+        for part_records, part_ps, part_cs in pool.map(_stats_worker, jobs):
+            records.extend(part_records)
+            _merge_counters(player_stats, part_ps, _PLAYER_COUNTERS)
+            _merge_counters(club_stats, part_cs, _CLUB_COUNTERS)
+    return records
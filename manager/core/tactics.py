@@ -106,10 +106,19 @@ COUNTER_MATRIX: Dict[Tuple[TacticName, TacticName], float] = {
     (TacticName.ATTACKING_433, TacticName.COUNTER_4141): 0.99,
 }
 
+# (offensiv, kort)-multiplikatorer per aggressivitet → en uppslagning per anrop
+_AGG_MODS: Dict[Aggression, Tuple[float, float]] = {
+    Aggression.LUGN: (0.99, 0.85),
+    Aggression.MEDEL: (1.00, 1.00),
+    Aggression.AGGRESSIV: (1.02, 1.20),
+}
+_AGG_NEUTRAL: Tuple[float, float] = (1.00, 1.00)
+
 
-def _avg_by_position(club: Club, pos: Position) -> float:
-    pool = [p.skill_open for p in club.players if p.position is pos]
-    return (sum(pool) / len(pool)) if pool else 5.0
+_GK = Position.GK
+_DF = Position.DF
+_MF = Position.MF
+_FW = Position.FW
 
 
 def unit_scores(club: Club, tactic: TacticProfile) -> Tuple[float, float, float, float]:
@@ -117,11 +126,7 @@ def unit_scores(club: Club, tactic: TacticProfile) -> Tuple[float, float, float,
     Returnerar (GK, DEF, MID, FWD) som vägt med spelarstyrka.
     Värdena är inte begränsade men kommer typiskt ligga kring 3–8.
     """
-    gk = _avg_by_position(club, Position.GK)
-    df = _avg_by_position(club, Position.DF)
-    mf = _avg_by_position(club, Position.MF)
-    fw = _avg_by_position(club, Position.FW)
-
+    gk, df, mf, fw = unit_averages(club)
     # Väg ihop med taktikvikter
     return (
         gk * tactic.w_gk,
@@ -131,15 +136,35 @@ def unit_scores(club: Club, tactic: TacticProfile) -> Tuple[float, float, float,
     )
 
 
+def unit_averages(club: Club) -> Tuple[float, float, float, float]:
+    """Snittstyrka (GK, DEF, MID, FWD) i truppen, oviktat."""
+    # Ett pass över truppen: summa/antal per lagdel (tom lagdel → 5.0)
+    gk_s = df_s = mf_s = fw_s = 0.0
+    gk_n = df_n = mf_n = fw_n = 0
+    for p in club.players:
+        pos = p.position
+        if pos is _GK:
+            gk_s += p.skill_open
+            gk_n += 1
+        elif pos is _DF:
+            df_s += p.skill_open
+            df_n += 1
+        elif pos is _MF:
+            mf_s += p.skill_open
+            mf_n += 1
+        elif pos is _FW:
+            fw_s += p.skill_open
+            fw_n += 1
+    gk = gk_s / gk_n if gk_n else 5.0
+    df = df_s / df_n if df_n else 5.0
+    mf = mf_s / mf_n if mf_n else 5.0
+    fw = fw_s / fw_n if fw_n else 5.0
+    return (gk, df, mf, fw)
+
+
 def aggression_modifiers(agg: Aggression) -> Tuple[float, float]:
     """
     Returnerar (offensiv_multiplikator, kort_multiplikator).
     LUGN ger färre kort, AGGRESSIV ger fler kort samt liten offensiv boost.
     """
-    if agg is Aggression.LUGN:
-        return (0.99, 0.85)
-    if agg is Aggression.MEDEL:
-        return (1.00, 1.00)
-    if agg is Aggression.AGGRESSIV:
-        return (1.02, 1.20)
-    return (1.00, 1.00)
+    return _AGG_MODS.get(agg, _AGG_NEUTRAL)
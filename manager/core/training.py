@@ -2,10 +2,10 @@ from __future__ import annotations
 
 import random
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from .club import Club
-from .player import Player
+from .player import Player, Trait, trait_bit
 
 
 @dataclass(slots=True)
@@ -23,26 +23,26 @@ class TrainingOrder:
 # --------- Hjälpare ---------
 
 
-def _find_club_and_player(
-    clubs: List[Club], club_name: str, player_id: int
-) -> Tuple[Club, Player]:
-    club = next((c for c in clubs if c.name.lower() == club_name.lower()), None)
+def _find_club_and_player(gs, club_name: str, player_id: int) -> Tuple[Club, Player]:
+    """
+    Slår upp klubben i alla divisioner (gs.find_club), inte bara den första,
+    så att även upp- eller nedflyttade klubbar kan träna.
+    """
+    club = gs.find_club(club_name)
     if not club:
         raise ValueError(f"Hittar ingen klubb '{club_name}'")
-    player = next((p for p in club.players if p.id == player_id), None)
+    player = gs.find_player(club.name, player_id)
     if not player:
         raise ValueError(f"Hittar ingen spelare med id={player_id} i {club.name}")
     return club, player
 
 
-def _has_trait(player: Player, *names: str) -> bool:
-    traits = getattr(player, "traits", []) or []
-    names_u = {n.upper() for n in names}
-    for t in traits:
-        nm = getattr(t, "name", str(t)).upper()
-        if nm in names_u:
-            return True
-    return False
+# Trait-masker för _has_trait
+_TRAINING_KEEN = trait_bit(Trait.TRANINGSVILLIG)
+
+
+def _has_trait(player: Player, mask: int) -> bool:
+    return (player.trait_mask & mask) != 0
 
 
 # --------- API ---------
@@ -54,19 +54,13 @@ def list_training(gs) -> List[TrainingOrder]:
 
 def start_form_training(gs, club_name: str, player_id: int) -> TrainingOrder:
     """Starta en veckas formträning för spelare. Drar 200k kr omedelbart."""
-    div = gs.league.divisions[0]
-    club, player = _find_club_and_player(div.clubs, club_name, player_id)
+    club, player = _find_club_and_player(gs, club_name, player_id)
 
-    # Kolla om redan aktiv order för spelaren
-    for o in gs.training_orders:
-        if (
-            o.status == "active"
-            and o.player_id == player_id
-            and o.club_name.lower() == club.name.lower()
-        ):
-            raise ValueError(
-                f"{player.first_name} {player.last_name} har redan aktiv formträning."
-            )
+    # Kolla om redan aktiv order för spelaren (ordrar lagrar klubbens exakta namn)
+    if (club.name, player.id) in gs.active_training:
+        raise ValueError(
+            f"{player.first_name} {player.last_name} har redan aktiv formträning."
+        )
 
     if getattr(club, "cash_sek", 0) < 200_000:
         raise ValueError(f"{club.name} har inte råd (behöver 200 000 kr).")
@@ -79,21 +73,20 @@ def start_form_training(gs, club_name: str, player_id: int) -> TrainingOrder:
     )
     order = TrainingOrder(id=next_id, club_name=club.name, player_id=player.id)
     gs.training_orders.append(order)
+    gs.active_training[(order.club_name, order.player_id)] = order
     return order
 
 
-def advance_week(gs) -> List[str]:
+def advance_week(gs, rng: Optional[random.Random] = None) -> List[str]:
     """
     Processa en 'vecka': decrement weeks_left, applicera form-boost när order når 0.
     Returnerar en lista med loggrader (trevliga att visa i CLI).
+    rng: egen slumpkälla (t.ex. random.Random(seed)) för reproducerbara veckor;
+    default är modulen random.
     """
     logs: List[str] = []
-    div = gs.league.divisions[0]
-
-    # Index för snabb lookup
-    club_ix = {c.name: c for c in div.clubs}
-    player_ix = {p.id: p for c in div.clubs for p in c.players}
-
+    # Fas 1: räkna ned och samla de order som blir klara denna vecka
+    due: List[Tuple[TrainingOrder, Club, Player]] = []
     for o in gs.training_orders:
         if o.status != "active":
             continue
@@ -102,19 +95,23 @@ def advance_week(gs) -> List[str]:
         if o.weeks_left > 0:
             continue
 
-        # Klar → applicera boost
-        club = club_ix.get(o.club_name)
-        player = player_ix.get(o.player_id)
+        # Index på GameState; spelare slås upp per klubb (id krockar mellan klubbar)
+        club = gs.find_club(o.club_name)
+        player = gs.find_player(o.club_name, o.player_id) if club else None
         if not (club and player):
             o.status = "done"
             o.note = "Spelare/klubb saknas vid slutförande."
+            gs.active_training.pop((o.club_name, o.player_id), None)
             continue
+        due.append((o, club, player))
 
-        base = random.randint(2, 5)  # 2–5
+    # Fas 2: applicera boost för alla klara order (samma slumpordning som förut)
+    randint = (rng or random).randint
+    for o, club, player in due:
+        base = randint(2, 5)  # 2–5
         bonus = 0
-        # robust trait-match mot TRÄNINGSVILLIG / TRAININGSVILLIG
-        if _has_trait(player, "TRÄNINGSVILLIG", "TRAININGSVILLIG"):
-            bonus = random.randint(1, 3)
+        if _has_trait(player, _TRAINING_KEEN):
+            bonus = randint(1, 3)
         boost = base + bonus
 
         # applicera
@@ -129,6 +126,7 @@ def advance_week(gs) -> List[str]:
 
         o.status = "done"
         o.note = f"+{boost} form (nu {new_now})"
+        gs.active_training.pop((o.club_name, o.player_id), None)
         logs.append(
             f"{club.name}: {player.first_name} {player.last_name} fick +{boost} form → {new_now} (säsong {season:.1f})"
         )
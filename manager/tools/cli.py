@@ -1,89 +1,146 @@
 from __future__ import annotations
 
-import argparse
+import heapq
+import os
+import sys
 import time
+from functools import lru_cache
 from pathlib import Path
-
-from manager.core import (
-    LeagueRules,
-    SeasonConfig,
-    build_league_schedule,
-    generate_league,
-    play_round,
+from types import SimpleNamespace
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
 )
-from manager.core.cup import CupRules
-from manager.core.cup_state import advance_cup_round, create_cup_state
-from manager.core.history import HistoryStore
-from manager.core.livefeed import format_feed, format_match_report
-from manager.core.season import Aggressiveness, Tactic
-from manager.core.season_progression import end_season
-from manager.core.standings import apply_result_to_table as apply_to_table
+
+# Moduler som bara ett fåtal kommandon behöver (generator, cup, livefeed,
+# träning, säsongsbyte) importeras i respektive cmd_* för snabbare uppstart.
+from manager.core.season import Aggressiveness, SeasonConfig, Tactic, play_round
 from manager.core.state import GameState
-from manager.core.stats import update_stats_from_result
-from manager.core.training import advance_week, list_training, start_form_training
+from manager.core.stats import update_stats_from_results_batch
+
+if TYPE_CHECKING:
+    # argparse importeras först i main() när kommandot behöver det
+    import argparse
+
+DEFAULT_SAVE = "saves/career.json"
 
 # ---------------------------
 # Hjälpare
 # ---------------------------
 
 
-def ensure_loaded(path: Path) -> GameState:
+# repl-läget: laddade GameState per sparfil och vilka som har osparade ändringar
+_repl = SimpleNamespace(active=False, states={}, dirty=set())
+
+
+def ensure_loaded(path: Path, keys: Optional[Iterable[str]] = None) -> GameState:
+    """Läs sparfilen; med `keys` bara de sektionerna (läskommandon)."""
+    if _repl.active:
+        gs = _repl.states.get(str(path))
+        if gs is not None:
+            return gs
     if not path.exists():
         raise SystemExit(f"Sparfilen finns inte: {path}")
+    if _repl.active:
+        gs = _repl.states[str(path)] = GameState.load(str(path))
+        return gs
+    if keys is not None:
+        return GameState.load_partial(str(path), keys)
     return GameState.load(str(path))
 
 
-def _update_table_snapshot(gs: GameState, results) -> None:
-    snap = gs.table_snapshot or {}
+def _save(gs: GameState, file: str | Path) -> None:
+    """Spara; i repl-läget hålls tillståndet i minnet tills 'save'/'quit'."""
+    if _repl.active:
+        key = str(Path(file))
+        _repl.states[key] = gs
+        _repl.dirty.add(key)
+        return
+    gs.save(file)
+
+
+def _saved_note(file: str | Path) -> str:
+    """Sparbekräftelse; i repl-läget skrivs filen först vid 'save'/'quit'."""
+    if _repl.active:
+        return f"Ej sparat än ('save'/'quit' skriver {file})"
+    return f"Sparat → {file}"
+
+
+def _flush_repl() -> None:
+    for key in sorted(_repl.dirty):
+        _repl.states[key].save(key)
+        print(f"Sparat → {key}")
+    _repl.dirty.clear()
+
+
+def _record_league_results(gs: GameState, results, round_no: int) -> None:
+    """Stats för hela omgången i ett anrop, sedan matchlogg och tabellsnapshot."""
+    from manager.core.standings import TALLY_FIELDS, result_tallies
+
+    records = update_stats_from_results_batch(
+        results,
+        competition="league",
+        round_no=round_no,
+        player_stats=gs.player_stats,
+        club_stats=gs.club_stats,
+    )
+    gs.record_matches(records)
+    # Samma radökningar som ligatabellen (defaultdict från ensure_containers)
+    snap = gs.table_snapshot
     for res in results:
-        tmp = {}
-        apply_to_table(tmp, res)
-        for _, row in tmp.items():
-            key = row.club.name
-            r = snap.get(
-                key,
-                {"mp": 0, "w": 0, "d": 0, "losses": 0, "gf": 0, "ga": 0, "pts": 0},
-            )
-            r["mp"] += row.mp
-            r["w"] += row.w
-            r["d"] += row.d
-            r["losses"] += row.losses
-            r["gf"] += row.gf
-            r["ga"] += row.ga
-            r["pts"] += row.pts
-            snap[key] = r
-    gs.table_snapshot = snap
+        th, ta = result_tallies(res.home_stats.goals, res.away_stats.goals)
+        for row, t in ((snap[res.home.name], th), (snap[res.away.name], ta)):
+            for key, inc in zip(TALLY_FIELDS, t):
+                row[key] += inc
+
+
+def _record_cup_results(gs: GameState, results) -> None:
+    """Stats och matchlogg för en cuprunda (rondnummer = nästa efter loggens)."""
+    records = update_stats_from_results_batch(
+        results,
+        competition="cup",
+        round_no=gs.max_cup_round + 1,
+        player_stats=gs.player_stats,
+        club_stats=gs.club_stats,
+    )
+    gs.record_matches(records)
 
 
 def _make_cfg(args) -> SeasonConfig:
+    # SeasonConfig har redan Tactic(attacking=True)/Tactic(defending=True) med
+    # tempo 1.0 som fallback; nya objekt behövs bara när tempot anges
     cfg = SeasonConfig()
-    th = (
-        float(args.tempo_home)
-        if getattr(args, "tempo_home", None) is not None
-        else cfg.home_tactic.tempo
-    )
-    ta = (
-        float(args.tempo_away)
-        if getattr(args, "tempo_away", None) is not None
-        else cfg.away_tactic.tempo
-    )
-    cfg.home_tactic = Tactic(attacking=True, tempo=th)
-    cfg.away_tactic = Tactic(defending=True, tempo=ta)
+    th = getattr(args, "tempo_home", None)
+    if th is not None:
+        cfg.home_tactic = Tactic(attacking=True, tempo=float(th))
+    ta = getattr(args, "tempo_away", None)
+    if ta is not None:
+        cfg.away_tactic = Tactic(defending=True, tempo=float(ta))
     return cfg
 
 
-def _play_round_common(gs: GameState, target_round: int, cfg: SeasonConfig):
+def _jobs(args) -> int:
+    """--jobs: antal processer för ligaomgången (-1 → alla kärnor)."""
+    jobs = getattr(args, "jobs", 1) or 1
+    return (os.cpu_count() or 1) if jobs < 0 else jobs
+
+
+def _play_round_common(
+    gs: GameState, target_round: int, cfg: SeasonConfig, workers: int = 1
+):
     div = gs.league.divisions[0]
     fixtures = gs.fixtures_by_division[div.name]
-    return play_round(fixtures, target_round, cfg), cfg
+    return play_round(fixtures, target_round, cfg, workers=workers), cfg
 
 
 def _find_club(gs: GameState, name: str):
-    for div in gs.league.divisions:
-        for c in div.clubs:
-            if c.name.lower() == name.lower():
-                return c
-    return None
+    return gs.find_club(name)
 
 
 def _print_tactic(c) -> None:
@@ -99,9 +156,7 @@ def _print_tactic(c) -> None:
 
 def _max_league_round(gs: GameState) -> int:
     """Högsta rondnumret i nuvarande ligaschema (för första divisionen)."""
-    div = gs.league.divisions[0]
-    rounds = [m.round for m in gs.fixtures_by_division.get(div.name, [])]
-    return max(rounds) if rounds else 1
+    return gs.last_scheduled_round(gs.league.divisions[0].name)
 
 
 # ---------------------------
@@ -110,6 +165,11 @@ def _max_league_round(gs: GameState) -> int:
 
 
 def cmd_new(args: argparse.Namespace) -> None:
+    from manager.core.generator import generate_league
+    from manager.core.history import HistoryStore
+    from manager.core.league import LeagueRules
+    from manager.core.schedule import build_league_schedule
+
     path = Path(args.file)
     if path.exists() and not args.force:
         raise SystemExit(
@@ -136,21 +196,26 @@ def cmd_new(args: argparse.Namespace) -> None:
     gs.ensure_containers()
 
     path.parent.mkdir(parents=True, exist_ok=True)
-    gs.save(str(path))
+    _save(gs, path)
     print(
         f"Ny karriär skapad: {path}  (Liga: {league.name}, Div: {league.divisions[0].name})"
     )
 
 
+# Status visar bara antal (via section_size) och cupläge; cupen behöver ligan
+_STATUS_SECTIONS = ("league", "cup_state")
+
+
 def cmd_status(args: argparse.Namespace) -> None:
-    gs = ensure_loaded(Path(args.file))
+    gs = ensure_loaded(Path(args.file), _STATUS_SECTIONS)
     div = gs.league.divisions[0]
     print(f"Säsong: {gs.season}")
     print(f"Liga: {gs.league.name}  Division: {div.name}  Klubbar: {len(div.clubs)}")
     print(f"Nästa ligaomgång: {gs.current_round}")
-    print(f"Matchlogg: {len(gs.match_log or [])} matcher")
+    print(f"Matchlogg: {gs.section_size('match_log')} matcher")
     print(
-        f"Spelare med stats: {len(gs.player_stats or {})}  Lag med stats: {len(gs.club_stats or {})}"
+        f"Spelare med stats: {gs.section_size('player_stats')}  "
+        f"Lag med stats: {gs.section_size('club_stats')}"
     )
     if gs.cup_state:
         print(
@@ -160,15 +225,13 @@ def cmd_status(args: argparse.Namespace) -> None:
         )
     else:
         print("Cup: ej startad")
-    if gs.training_orders:
-        print(
-            f"Träningsordrar: {len(gs.training_orders)} (kör 'training-status' för detaljer)"
-        )
+    n_orders = gs.section_size("training_orders")
+    if n_orders:
+        print(f"Träningsordrar: {n_orders} (kör 'training-status' för detaljer)")
 
 
 def cmd_play_round(args: argparse.Namespace) -> None:
     gs = ensure_loaded(Path(args.file))
-    gs.ensure_containers()
 
     cfg = _make_cfg(args)
     target_round = gs.current_round
@@ -182,29 +245,39 @@ def cmd_play_round(args: argparse.Namespace) -> None:
             )
             return
 
-    results, _cfg = _play_round_common(gs, target_round, cfg)
+    results, _cfg = _play_round_common(gs, target_round, cfg, _jobs(args))
 
-    for res in results:
-        mr = update_stats_from_result(
-            res,
-            competition="league",
-            round_no=target_round,
-            player_stats=gs.player_stats,
-            club_stats=gs.club_stats,
-        )
-        gs.match_log.append(mr)
-    _update_table_snapshot(gs, results)
+    _record_league_results(gs, results, target_round)
 
     gs.current_round = target_round + 1
-    gs.save(args.file)
+    _save(gs, args.file)
     print(
-        f"Spelade ligaomgång {target_round}: {len(results)} matcher. Sparat → {args.file}"
+        f"Spelade ligaomgång {target_round}: {len(results)} matcher. {_saved_note(args.file)}"
     )
 
 
+def _write_feeds(results, label: str, delay: Optional[float]) -> None:
+    """Livefeed + rapport per match. Utan paus skrivs allt med ett anrop."""
+    from manager.core.livefeed import format_feed, format_match_report
+
+    write = sys.stdout.write
+    blocks = []
+    for i, res in enumerate(results, start=1):
+        block = f"\n### {label} {i}\n{format_feed(res)}\n\n{format_match_report(res)}\n"
+        if delay:
+            write(block)
+            sys.stdout.flush()
+            time.sleep(delay)
+        else:
+            blocks.append(block)
+    if blocks:
+        write("".join(blocks))
+
+
 def cmd_watch(args: argparse.Namespace) -> None:
+    from manager.core.cup_state import advance_cup_round
+
     gs = ensure_loaded(Path(args.file))
-    gs.ensure_containers()
     delay = float(args.slow) if args.slow else None
 
     cfg = _make_cfg(args)
@@ -224,34 +297,13 @@ def cmd_watch(args: argparse.Namespace) -> None:
         )
 
         print(f"=== Cuprunda ({len(results)} matcher) ===")
-        for i, res in enumerate(results, start=1):
-            print(f"\n### Cupmatch {i}")
-            print(format_feed(res))
-            print()
-            print(format_match_report(res))
-            if delay:
-                time.sleep(delay)
-
-        round_index = (
-            max(
-                (mr.round for mr in (gs.match_log or []) if mr.competition == "cup"),
-                default=0,
-            )
-            + 1
-        )
-        for res in results:
-            mr = update_stats_from_result(
-                res,
-                competition="cup",
-                round_no=round_index,
-                player_stats=gs.player_stats,
-                club_stats=gs.club_stats,
-            )
-            gs.match_log.append(mr)
+        _write_feeds(results, "Cupmatch", delay)
 
-        gs.save(args.file)
+        _record_cup_results(gs, results)
+
+        _save(gs, args.file)
         print(
-            f"\nCuprunda klar. Sparat → {args.file}. "
+            f"\nCuprunda klar. {_saved_note(args.file)}. "
             f"Kvar lag: {len(gs.cup_state.current_clubs)} | Klar: {gs.cup_state.finished}"
         )
         if gs.cup_state.finished and gs.cup_state.winner:
@@ -268,36 +320,24 @@ def cmd_watch(args: argparse.Namespace) -> None:
                 return
 
         target_round = gs.current_round
-        results, _cfg = _play_round_common(gs, target_round, cfg)
+        results, _cfg = _play_round_common(gs, target_round, cfg, _jobs(args))
 
         print(f"=== Omgång {target_round} ({len(results)} matcher) ===")
-        for i, res in enumerate(results, start=1):
-            print(f"\n### Match {i}")
-            print(format_feed(res))
-            print()
-            print(format_match_report(res))
-            if delay:
-                time.sleep(delay)
-
-        for res in results:
-            mr = update_stats_from_result(
-                res,
-                competition="league",
-                round_no=target_round,
-                player_stats=gs.player_stats,
-                club_stats=gs.club_stats,
-            )
-            gs.match_log.append(mr)
-        _update_table_snapshot(gs, results)
+        _write_feeds(results, "Match", delay)
+
+        _record_league_results(gs, results, target_round)
 
         gs.current_round = target_round + 1
-        gs.save(args.file)
+        _save(gs, args.file)
         print(
-            f"\nOmgång {target_round} klar. Sparat → {args.file}. Nästa omgång: {gs.current_round}"
+            f"\nOmgång {target_round} klar. {_saved_note(args.file)}. Nästa omgång: {gs.current_round}"
         )
 
 
 def cmd_start_cup(args: argparse.Namespace) -> None:
+    from manager.core.cup import CupRules
+    from manager.core.cup_state import create_cup_state
+
     gs = ensure_loaded(Path(args.file))
     if gs.cup_state and not gs.cup_state.finished:
         print("Cup finns redan och pågår.")
@@ -310,13 +350,14 @@ def cmd_start_cup(args: argparse.Namespace) -> None:
             two_legged=not args.single_leg, final_two_legged=args.final_two_legged
         ),
     )
-    gs.save(args.file)
+    _save(gs, args.file)
     print(f"Cup startad: {len(gs.cup_state.current_clubs)} lag i spel.")
 
 
 def cmd_play_cup_round(args: argparse.Namespace) -> None:
+    from manager.core.cup_state import advance_cup_round
+
     gs = ensure_loaded(Path(args.file))
-    gs.ensure_containers()
     if not gs.cup_state:
         raise SystemExit("Ingen cup är startad. Kör: start-cup")
 
@@ -330,24 +371,9 @@ def cmd_play_cup_round(args: argparse.Namespace) -> None:
         away_aggr=cfg.away_aggr,
     )
 
-    round_index = (
-        max(
-            (mr.round for mr in (gs.match_log or []) if mr.competition == "cup"),
-            default=0,
-        )
-        + 1
-    )
-    for res in rnd:
-        mr = update_stats_from_result(
-            res,
-            competition="cup",
-            round_no=round_index,
-            player_stats=gs.player_stats,
-            club_stats=gs.club_stats,
-        )
-        gs.match_log.append(mr)
+    _record_cup_results(gs, rnd)
 
-    gs.save(args.file)
+    _save(gs, args.file)
     print(
         f"Spelade {len(rnd)} cupmatcher. Kvar: {len(gs.cup_state.current_clubs)} lag. "
         f"Klar: {gs.cup_state.finished}."
@@ -361,110 +387,85 @@ def cmd_play_cup_round(args: argparse.Namespace) -> None:
 # ---------------------------
 
 
-def _top_players(gs: GameState, by: str, limit: int) -> None:
-    gs.ensure_containers()
-    stats = list(gs.player_stats.values())
-
-    def key_rating(s):
-        return (s.rating_avg, s.goals, s.assists)
+def _top_n(values, key, limit: int) -> list:
+    """De `limit` största enligt `key` (stabil ordning som sorted(...)[:limit])."""
+    if limit <= 0 or limit >= len(values):
+        return sorted(values, key=key, reverse=True)[:limit]
+    return heapq.nlargest(limit, values, key=key)
 
-    def key_goals(s):
-        return (s.goals, s.assists, s.rating_avg)
 
-    def key_assists(s):
-        return (s.assists, s.goals, s.rating_avg)
+# Sorteringsnycklar per --by (sort/nlargest anropar nyckeln en gång per rad)
+_PLAYER_SORT_KEYS: Dict[str, Callable[[Any], tuple]] = {
+    "rating": lambda s: (s.rating_avg, s.goals, s.assists),
+    "goals": lambda s: (s.goals, s.assists, s.rating_avg),
+    "assists": lambda s: (s.assists, s.goals, s.rating_avg),
+    "yellows": lambda s: (s.yellows, s.reds),
+    "reds": lambda s: (s.reds, s.yellows),
+}
 
-    def key_yellows(s):
-        return (s.yellows, s.reds)
+_CLUB_SORT_KEYS: Dict[str, Callable[[Any], tuple]] = {
+    "points": lambda c: (c.points, c.goals_for - c.goals_against, c.goals_for),
+    "gf": lambda c: (c.goals_for,),
+    "ga": lambda c: (-c.goals_against,),
+    "clean_sheets": lambda c: (c.clean_sheets,),
+    "yellows": lambda c: (c.yellows,),
+    "reds": lambda c: (c.reds,),
+}
 
-    def key_reds(s):
-        return (s.reds, s.yellows)
 
-    if by == "rating":
-        key = key_rating
-    elif by == "goals":
-        key = key_goals
-    elif by == "assists":
-        key = key_assists
-    elif by == "yellows":
-        key = key_yellows
-    elif by == "reds":
-        key = key_reds
-    else:
+def _top_players(gs: GameState, by: str, limit: int) -> None:
+    stats = gs.player_stats.values()
+    key = _PLAYER_SORT_KEYS.get(by)
+    if key is None:
         raise SystemExit(f"Okänt fält för players: {by}")
 
-    stats.sort(key=key, reverse=True)
+    top = _top_n(stats, key, limit)
     print(f"TOP PLAYERS by {by} (limit {limit})")
     print(
         f"{'#':>2}  {'PlayerID':>7}  {'Club':<18}  {'App':>3} {'Min':>4}  {'G':>2} {'A':>2}  {'Y':>2} {'R':>2}  {'Rt':>4}"
     )
-    for i, s in enumerate(stats[:limit], start=1):
-        print(
+    sys.stdout.write(
+        "".join(
             f"{i:>2}  {s.player_id:>7}  {s.club_name:<18}  "
             f"{s.appearances:>3} {s.minutes:>4}  {s.goals:>2} {s.assists:>2}  "
-            f"{s.yellows:>2} {s.reds:>2}  {s.rating_avg:>4.1f}"
+            f"{s.yellows:>2} {s.reds:>2}  {s.rating_avg:>4.1f}\n"
+            for i, s in enumerate(top, start=1)
         )
+    )
 
 
 def _top_clubs(gs: GameState, by: str, limit: int) -> None:
-    gs.ensure_containers()
-    stats = list(gs.club_stats.values())
-
-    def key_points(c):
-        return (c.points, c.goals_for - c.goals_against, c.goals_for)
-
-    def key_gf(c):
-        return (c.goals_for,)
-
-    def key_ga(c):
-        return (-c.goals_against,)
-
-    def key_cs(c):
-        return (c.clean_sheets,)
-
-    def key_yellows(c):
-        return (c.yellows,)
-
-    def key_reds(c):
-        return (c.reds,)
-
-    if by == "points":
-        key = key_points
-    elif by == "gf":
-        key = key_gf
-    elif by == "ga":
-        key = key_ga
-    elif by == "clean_sheets":
-        key = key_cs
-    elif by == "yellows":
-        key = key_yellows
-    elif by == "reds":
-        key = key_reds
-    else:
+    stats = gs.club_stats.values()
+    key = _CLUB_SORT_KEYS.get(by)
+    if key is None:
         raise SystemExit(f"Okänt fält för clubs: {by}")
 
-    stats.sort(key=key, reverse=True)
+    top = _top_n(stats, key, limit)
     print(f"TOP CLUBS by {by} (limit {limit})")
     print(
         f"{'#':>2}  {'Club':<20} {'P':>3} {'W':>3} {'D':>3} {'L':>3}  {'GF':>3} {'GA':>3} {'CS':>3}  {'Y':>3} {'R':>3}  {'Pts':>3}"
     )
-    for i, c in enumerate(stats[:limit], start=1):
-        print(
+    sys.stdout.write(
+        "".join(
             f"{i:>2}  {c.club_name:<20} {c.played:>3} {c.wins:>3} {c.draws:>3} "
             f"{c.losses:>3}  {c.goals_for:>3} {c.goals_against:>3} {c.clean_sheets:>3}  "
-            f"{c.yellows:>3} {c.reds:>3}  {c.points:>3}"
+            f"{c.yellows:>3} {c.reds:>3}  {c.points:>3}\n"
+            for i, c in enumerate(top, start=1)
         )
+    )
 
 
 def _show_match_log(gs: GameState, limit: int) -> None:
-    gs.ensure_containers()
     log = gs.match_log[-limit:] if limit > 0 else gs.match_log
     print(f"LAST {len(log)} MATCHES")
-    for i, mr in enumerate(log, start=max(1, len(gs.match_log or []) - len(log) + 1)):
-        tag = "L" if mr.competition == "league" else "C"
-        print(
-            f"{i:>3} [{tag}] R{mr.round:<2}  {mr.home} {mr.home_goals}-{mr.away_goals} {mr.away}"
+    first = max(1, len(gs.match_log or []) - len(log) + 1)
+    sys.stdout.write(
+        "".join(
+            f"{i:>3} [{'L' if mr.competition == 'league' else 'C'}] R{mr.round:<2}  "
+            f"{mr.home} {mr.home_goals}-{mr.away_goals} {mr.away}\n"
+            for i, mr in enumerate(log, start=first)
         )
+    )
 
 
 # ---------------------------
@@ -473,7 +474,7 @@ def _show_match_log(gs: GameState, limit: int) -> None:
 
 
 def cmd_tactic_show(args):
-    gs = ensure_loaded(Path(args.file))
+    gs = ensure_loaded(Path(args.file), ("league",))
     club = _find_club(gs, args.club)
     if not club:
         raise SystemExit(f"Hittade ingen klubb med namn: {args.club}")
@@ -482,7 +483,6 @@ def cmd_tactic_show(args):
 
 def cmd_tactic_set(args):
     gs = ensure_loaded(Path(args.file))
-    gs.ensure_containers()
     club = _find_club(gs, args.club)
     if not club:
         raise SystemExit(f"Hittade ingen klubb med namn: {args.club}")
@@ -506,7 +506,7 @@ def cmd_tactic_set(args):
             raise SystemExit("Ogiltig aggressivitet. Använd: Aggressiv | Medel | Lugn")
         club.aggressiveness = Aggressiveness(name)
 
-    gs.save(args.file)
+    _save(gs, args.file)
     print("Uppdaterad taktik:")
     _print_tactic(club)
 
@@ -517,20 +517,23 @@ def cmd_tactic_set(args):
 
 
 def cmd_training_start(args):
+    from manager.core.training import start_form_training
+
     gs = ensure_loaded(Path(args.file))
-    gs.ensure_containers()
     try:
         order = start_form_training(gs, args.club, args.player)
     except ValueError as e:
         raise SystemExit(str(e))
-    gs.save(args.file)
+    _save(gs, args.file)
     print(
         f"Startade formträning: order #{order.id} för spelare {order.player_id} i {order.club_name} (200 000 kr)."
     )
 
 
 def cmd_training_status(args):
-    gs = ensure_loaded(Path(args.file))
+    from manager.core.training import list_training
+
+    gs = ensure_loaded(Path(args.file), ("training_orders",))
     rows = list_training(gs)
     if not rows:
         print("Inga träningsordrar.")
@@ -543,10 +546,11 @@ def cmd_training_status(args):
 
 
 def cmd_advance_week(args):
+    from manager.core.training import advance_week
+
     gs = ensure_loaded(Path(args.file))
-    gs.ensure_containers()
     logs = advance_week(gs)
-    gs.save(args.file)
+    _save(gs, args.file)
     if not logs:
         print("Veckan passerade. Inga formboostar den här gången.")
         return
@@ -561,8 +565,9 @@ def cmd_advance_week(args):
 
 
 def cmd_end_season(args):
+    from manager.core.season_progression import end_season
+
     gs = ensure_loaded(Path(args.file))
-    gs.ensure_containers()
 
     results = end_season(gs)
 
@@ -581,203 +586,445 @@ def cmd_end_season(args):
             key=lambda r: (r.bars_delta, r.bars_after, r.name), reverse=True
         )
 
-    with report_path.open("w", encoding="utf-8") as f:
-        f.write(f"SÄSONGSRAPPORT – Slut på säsong {gs.season - 1}\n")
-        f.write("=" * 72 + "\n\n")
-        f.write(
-            "Kolumner:  Namn  (Ålder)  Minuter  Form_säs  Bars before→after  (Δ)  Not\n\n"
-        )
+    # Bygg hela rapporten i minnet och skriv den med ett enda anrop
+    parts: List[str] = [
+        f"SÄSONGSRAPPORT – Slut på säsong {gs.season - 1}\n",
+        "=" * 72 + "\n\n",
+        "Kolumner:  Namn  (Ålder)  Minuter  Form_säs  Bars before→after  (Δ)  Not\n\n",
+    ]
+    add = parts.append
 
-        total_up = total_down = 0
-
-        for club in club_names:
-            rows = by_club[club]
-            ups = sum(1 for r in rows if r.bars_delta > 0)
-            downs = sum(1 for r in rows if r.bars_delta < 0)
-            total_up += ups
-            total_down += downs
-
-            f.write(f"{club}\n")
-            f.write("-" * len(club) + "\n")
-
-            for r in rows:
-                pr = int(round(r.play_ratio * 100))
-                delta = f"{r.bars_delta:+d}"
-                f.write(
-                    f"  {r.name:<22}  ({r.age:>2})  "
-                    f"min {r.minutes:>4} ({pr:>3}%)  "
-                    f"form_säs {r.form_season_before:>4.1f}  "
-                    f"bars {r.bars_before:>2}→{r.bars_after:>2}  ({delta:>+3})  "
-                    f"{r.note}\n"
-                )
-            f.write(f"  └─ Summering: förbättrades: {ups}, försämrades: {downs}\n\n")
+    total_up = total_down = 0
 
-        f.write("-" * 72 + "\n")
-        f.write(f"TOTALT – förbättrades: {total_up}, försämrades: {total_down}\n")
+    for club in club_names:
+        rows = by_club[club]
+        ups = sum(1 for r in rows if r.bars_delta > 0)
+        downs = sum(1 for r in rows if r.bars_delta < 0)
+        total_up += ups
+        total_down += downs
+
+        add(f"{club}\n")
+        add("-" * len(club) + "\n")
+
+        for r in rows:
+            pr = int(round(r.play_ratio * 100))
+            delta = f"{r.bars_delta:+d}"
+            add(
+                f"  {r.name:<22}  ({r.age:>2})  "
+                f"min {r.minutes:>4} ({pr:>3}%)  "
+                f"form_säs {r.form_season_before:>4.1f}  "
+                f"bars {r.bars_before:>2}→{r.bars_after:>2}  ({delta:>+3})  "
+                f"{r.note}\n"
+            )
+        add(f"  └─ Summering: förbättrades: {ups}, försämrades: {downs}\n\n")
 
-    gs.save(args.file)
+    add("-" * 72 + "\n")
+    add(f"TOTALT – förbättrades: {total_up}, försämrades: {total_down}\n")
+    report_path.write_text("".join(parts), encoding="utf-8")
+
+    _save(gs, args.file)
     print(f"Säsong avslutad. Ny säsong: {gs.season}. Rapport sparad → {report_path}")
     print("Tips: kör 'status' och 'watch' för att se nya omgång 1.")
 
 
 # ---------------------------
-# Parser
+# Interaktivt läge
 # ---------------------------
 
+# Kommandon som skrivs till disk direkt även i repl-läget
+_REPL_WRITE_THROUGH = frozenset({"new", "end-season"})
 
-def main() -> None:
-    p = argparse.ArgumentParser(prog="manager-cli", description="Managerspelet CLI")
-    p.add_argument(
-        "--file", "-f", default="saves/career.json", help="Sökväg till sparfilen (JSON)"
-    )
-    sub = p.add_subparsers(dest="cmd", required=True)
 
-    p_new = sub.add_parser("new", help="Skapa ny karriär")
-    p_new.add_argument("--name", default="KarriärLiga")
-    p_new.add_argument("--teams", type=int, default=8)
-    p_new.add_argument(
-        "--single-round", action="store_true", help="Spela bara enkelmöten i ligan"
-    )
-    p_new.add_argument("--force", action="store_true", help="Skriv över befintlig fil")
-    p_new.set_defaults(func=cmd_new)
-
-    p_status = sub.add_parser("status", help="Visa save-status")
-    p_status.set_defaults(func=cmd_status)
-
-    def add_tempo_args(sp: argparse.ArgumentParser):
-        sp.add_argument(
-            "--tempo-home",
-            type=float,
-            default=None,
-            help="Tempo för hemmalag (t.ex. 0.9, 1.0, 1.2)",
-        )
-        sp.add_argument(
-            "--tempo-away",
-            type=float,
-            default=None,
-            help="Tempo för bortalag (t.ex. 0.9, 1.0, 1.2)",
-        )
+def cmd_repl(args) -> None:
+    """Läs kommandon från stdin mot en sparfil som bara laddas en gång."""
+    import shlex
 
-    p_round = sub.add_parser("play-round", help="Spela exakt en ligaomgång och spara")
-    add_tempo_args(p_round)
-    p_round.set_defaults(func=cmd_play_round)
+    if _repl.active:
+        print("Redan i repl-läge.")
+        return
+    _repl.active = True
+    print(f"repl: {args.file}  ('save' sparar, 'quit' sparar och avslutar)")
+    try:
+        while True:
+            try:
+                line = input("> ")
+            except EOFError:
+                print()
+                break
+            try:
+                tokens = shlex.split(line)
+            except ValueError as e:
+                print(f"Fel: {e}")
+                continue
+            if not tokens:
+                continue
+            if tokens[0] in ("quit", "exit"):
+                break
+            if tokens[0] == "save":
+                if not _repl.dirty:
+                    print("Inget att spara.")
+                _flush_repl()
+                continue
+
+            argv = ["--file", args.file, *tokens]
+            try:
+                sub = build_parser(_command_token(argv)).parse_args(argv)
+                sub.func(sub)
+            except SystemExit as e:
+                # Kommandon och argparse avbryter med SystemExit → nästa rad
+                if isinstance(e.code, str):
+                    print(e.code)
+                continue
+            if tokens[0] in _REPL_WRITE_THROUGH:
+                _flush_repl()
+    finally:
+        _flush_repl()
+        _repl.active = False
 
-    p_watch = sub.add_parser(
-        "watch",
-        help="Spela nästa ligaomgång (default) eller cuprunda (--cup) med livefeed",
-    )
-    p_watch.add_argument(
-        "--cup", action="store_true", help="Titta på cuprunda istället för ligaomgång"
-    )
-    p_watch.add_argument(
-        "--slow",
-        nargs="?",
-        default=None,
-        help="Sekunders paus mellan matcher (valfritt)",
-    )
-    add_tempo_args(p_watch)
-    p_watch.set_defaults(func=cmd_watch)
 
-    p_start_cup = sub.add_parser(
-        "start-cup", help="Starta cupen i den aktuella säsongen"
-    )
-    p_start_cup.add_argument(
-        "--single-leg",
-        action="store_true",
-        help="Gör cupen enkelmöten (final styrs separat)",
-    )
-    p_start_cup.add_argument(
-        "--final-two-legged",
-        action="store_true",
-        help="Gör även finalen dubbelmöte (default: enkel)",
-    )
-    p_start_cup.set_defaults(func=cmd_start_cup)
+# ---------------------------
+# Parser
+# ---------------------------
 
-    p_cup_round = sub.add_parser(
-        "play-cup-round", help="Spela exakt en cuprunda och spara (utan livefeed)"
-    )
-    add_tempo_args(p_cup_round)
-    p_cup_round.set_defaults(func=cmd_play_cup_round)
-
-    p_top_p = sub.add_parser("top-players", help="Visa topplista för spelare")
-    p_top_p.add_argument(
-        "--by",
-        choices=["goals", "assists", "rating", "yellows", "reds"],
-        default="goals",
-    )
-    p_top_p.add_argument("--limit", type=int, default=10)
-    p_top_p.set_defaults(
-        func=lambda a: _top_players(ensure_loaded(Path(a.file)), a.by, a.limit)
-    )
 
-    p_top_c = sub.add_parser("top-clubs", help="Visa topplista för klubbar")
-    p_top_c.add_argument(
-        "--by",
-        choices=["points", "gf", "ga", "clean_sheets", "yellows", "reds"],
-        default="points",
-    )
-    p_top_c.add_argument("--limit", type=int, default=10)
-    p_top_c.set_defaults(
-        func=lambda a: _top_clubs(ensure_loaded(Path(a.file)), a.by, a.limit)
+# Kommandon som körs utan egna flaggor → dispatch utan argparse (snabbare uppstart).
+# Tempo-flaggorna har default None, så play-round/play-cup-round ryms också här.
+_SIMPLE_COMMANDS = {
+    "status": cmd_status,
+    "play-round": cmd_play_round,
+    "play-cup-round": cmd_play_cup_round,
+    "training-status": cmd_training_status,
+    "advance-week": cmd_advance_week,
+}
+
+
+def _fast_args(argv: List[str]) -> Optional[SimpleNamespace]:
+    """Tolka `[--file X | -f X | --file=X] <kommando>`; None → argparse behövs."""
+    file = DEFAULT_SAVE
+    rest = argv
+    if len(argv) >= 2 and argv[0] in ("--file", "-f"):
+        file, rest = argv[1], argv[2:]
+    elif argv and argv[0].startswith("--file="):
+        file, rest = argv[0][len("--file=") :], argv[1:]
+    if len(rest) != 1 or file.startswith("-"):
+        return None
+    func = _SIMPLE_COMMANDS.get(rest[0])
+    if func is None:
+        return None
+    return SimpleNamespace(
+        file=file, cmd=rest[0], func=func, tempo_home=None, tempo_away=None
     )
 
-    p_mlog = sub.add_parser("match-log", help="Visa senaste matcher ur sparfilen")
-    p_mlog.add_argument(
-        "--limit", type=int, default=20, help="Hur många matcher att visa (0=alla)"
-    )
-    p_mlog.set_defaults(
-        func=lambda a: _show_match_log(ensure_loaded(Path(a.file)), a.limit)
-    )
 
-    p_tshow = sub.add_parser("tactic-show", help="Visa taktik för en klubb")
-    p_tshow.add_argument("club", help="Klubbnamn exakt som i spelet")
-    p_tshow.set_defaults(func=cmd_tactic_show)
+# ---------------------------
+# Kommandotabell (deklarativ) → argparse
+# ---------------------------
 
-    p_tset = sub.add_parser(
-        "tactic-set", help="Ändra taktik/aggressivitet för en klubb"
-    )
-    p_tset.add_argument("club", help="Klubbnamn exakt som i spelet")
-    p_tset.add_argument(
-        "--attacking", type=int, choices=[0, 1], default=None, help="1 eller 0"
-    )
-    p_tset.add_argument(
-        "--defending", type=int, choices=[0, 1], default=None, help="1 eller 0"
-    )
-    p_tset.add_argument(
-        "--offside-trap", type=int, choices=[0, 1], default=None, help="1 eller 0"
-    )
-    p_tset.add_argument("--tempo", type=float, default=None, help="t.ex. 0.9, 1.0, 1.2")
-    p_tset.add_argument(
-        "--aggr", type=str, default=None, help="Aggressiv | Medel | Lugn"
-    )
-    p_tset.set_defaults(func=cmd_tactic_set)
+# Ett argument: (flaggor/namn, kwargs till add_argument)
+_Arg = Tuple[Tuple[str, ...], Dict[str, Any]]
+
+_TEMPO_ARGS: List[_Arg] = [
+    (
+        ("--tempo-home",),
+        {
+            "type": float,
+            "default": None,
+            "help": "Tempo för hemmalag (t.ex. 0.9, 1.0, 1.2)",
+        },
+    ),
+    (
+        ("--tempo-away",),
+        {
+            "type": float,
+            "default": None,
+            "help": "Tempo för bortalag (t.ex. 0.9, 1.0, 1.2)",
+        },
+    ),
+]
+
+_JOBS_ARG: _Arg = (
+    ("--jobs", "-j"),
+    {
+        "type": int,
+        "default": 1,
+        "help": "Simulera ligaomgångens matcher i N processer (-1 = alla kärnor)",
+    },
+)
 
+
+def cmd_top_players(args) -> None:
+    gs = ensure_loaded(Path(args.file), ("player_stats",))
+    _top_players(gs, args.by, args.limit)
+
+
+def cmd_top_clubs(args) -> None:
+    gs = ensure_loaded(Path(args.file), ("club_stats",))
+    _top_clubs(gs, args.by, args.limit)
+
+
+def cmd_match_log(args) -> None:
+    gs = ensure_loaded(Path(args.file), ("match_log",))
+    _show_match_log(gs, args.limit)
+
+
+# (kommando, hjälptext, funktion, argument)
+COMMANDS: List[Tuple[str, str, Callable[[Any], None], List[_Arg]]] = [
+    (
+        "new",
+        "Skapa ny karriär",
+        cmd_new,
+        [
+            (("--name",), {"default": "KarriärLiga"}),
+            (("--teams",), {"type": int, "default": 8}),
+            (
+                ("--single-round",),
+                {"action": "store_true", "help": "Spela bara enkelmöten i ligan"},
+            ),
+            (
+                ("--force",),
+                {"action": "store_true", "help": "Skriv över befintlig fil"},
+            ),
+        ],
+    ),
+    ("status", "Visa save-status", cmd_status, []),
+    (
+        "play-round",
+        "Spela exakt en ligaomgång och spara",
+        cmd_play_round,
+        [*_TEMPO_ARGS, _JOBS_ARG],
+    ),
+    (
+        "watch",
+        "Spela nästa ligaomgång (default) eller cuprunda (--cup) med livefeed",
+        cmd_watch,
+        [
+            (
+                ("--cup",),
+                {
+                    "action": "store_true",
+                    "help": "Titta på cuprunda istället för ligaomgång",
+                },
+            ),
+            (
+                ("--slow",),
+                {
+                    "nargs": "?",
+                    "default": None,
+                    "help": "Sekunders paus mellan matcher (valfritt)",
+                },
+            ),
+            *_TEMPO_ARGS,
+            _JOBS_ARG,
+        ],
+    ),
+    (
+        "start-cup",
+        "Starta cupen i den aktuella säsongen",
+        cmd_start_cup,
+        [
+            (
+                ("--single-leg",),
+                {
+                    "action": "store_true",
+                    "help": "Gör cupen enkelmöten (final styrs separat)",
+                },
+            ),
+            (
+                ("--final-two-legged",),
+                {
+                    "action": "store_true",
+                    "help": "Gör även finalen dubbelmöte (default: enkel)",
+                },
+            ),
+        ],
+    ),
+    (
+        "play-cup-round",
+        "Spela exakt en cuprunda och spara (utan livefeed)",
+        cmd_play_cup_round,
+        _TEMPO_ARGS,
+    ),
+    (
+        "top-players",
+        "Visa topplista för spelare",
+        cmd_top_players,
+        [
+            (
+                ("--by",),
+                {
+                    "choices": ["goals", "assists", "rating", "yellows", "reds"],
+                    "default": "goals",
+                },
+            ),
+            (("--limit",), {"type": int, "default": 10}),
+        ],
+    ),
+    (
+        "top-clubs",
+        "Visa topplista för klubbar",
+        cmd_top_clubs,
+        [
+            (
+                ("--by",),
+                {
+                    "choices": [
+                        "points",
+                        "gf",
+                        "ga",
+                        "clean_sheets",
+                        "yellows",
+                        "reds",
+                    ],
+                    "default": "points",
+                },
+            ),
+            (("--limit",), {"type": int, "default": 10}),
+        ],
+    ),
+    (
+        "match-log",
+        "Visa senaste matcher ur sparfilen",
+        cmd_match_log,
+        [
+            (
+                ("--limit",),
+                {
+                    "type": int,
+                    "default": 20,
+                    "help": "Hur många matcher att visa (0=alla)",
+                },
+            ),
+        ],
+    ),
+    (
+        "tactic-show",
+        "Visa taktik för en klubb",
+        cmd_tactic_show,
+        [(("club",), {"help": "Klubbnamn exakt som i spelet"})],
+    ),
+    (
+        "tactic-set",
+        "Ändra taktik/aggressivitet för en klubb",
+        cmd_tactic_set,
+        [
+            (("club",), {"help": "Klubbnamn exakt som i spelet"}),
+            (
+                ("--attacking",),
+                {"type": int, "choices": [0, 1], "default": None, "help": "1 eller 0"},
+            ),
+            (
+                ("--defending",),
+                {"type": int, "choices": [0, 1], "default": None, "help": "1 eller 0"},
+            ),
+            (
+                ("--offside-trap",),
+                {"type": int, "choices": [0, 1], "default": None, "help": "1 eller 0"},
+            ),
+            (
+                ("--tempo",),
+                {"type": float, "default": None, "help": "t.ex. 0.9, 1.0, 1.2"},
+            ),
+            (
+                ("--aggr",),
+                {"type": str, "default": None, "help": "Aggressiv | Medel | Lugn"},
+            ),
+        ],
+    ),
     # --- Training-kommandon ---
-    p_tstart = sub.add_parser(
-        "training-start", help="Starta formträning (1 vecka, 200k) för en spelare"
-    )
-    p_tstart.add_argument("--club", required=True, help="Klubbnamn")
-    p_tstart.add_argument("--player", type=int, required=True, help="Spelar-ID")
-    p_tstart.set_defaults(func=cmd_training_start)
+    (
+        "training-start",
+        "Starta formträning (1 vecka, 200k) för en spelare",
+        cmd_training_start,
+        [
+            (("--club",), {"required": True, "help": "Klubbnamn"}),
+            (("--player",), {"type": int, "required": True, "help": "Spelar-ID"}),
+        ],
+    ),
+    (
+        "training-status",
+        "Visa status för alla träningsordrar",
+        cmd_training_status,
+        [],
+    ),
+    (
+        "advance-week",
+        "Processa en vecka (formträning m.m.)",
+        cmd_advance_week,
+        [],
+    ),
+    # --- End Season ---
+    (
+        "end-season",
+        "Avsluta säsongen: spelarförändringar, ny säsong & rapport",
+        cmd_end_season,
+        [
+            (
+                ("--report",),
+                {
+                    "default": "saves/season_report.txt",
+                    "help": "Sökväg för rapportfilen",
+                },
+            ),
+        ],
+    ),
+    (
+        "repl",
+        "Interaktivt läge: ladda sparfilen en gång och kör flera kommandon",
+        cmd_repl,
+        [],
+    ),
+]
+
+
+_COMMAND_NAMES = frozenset(name for name, _, _, _ in COMMANDS)
+
+
+@lru_cache(maxsize=None)
+def build_parser(only: Optional[str] = None) -> "argparse.ArgumentParser":
+    """Bygg argparse-trädet från COMMANDS (cachas vid återanvändning).
+
+    Med `only` byggs bara det kommandots underparser; används när kommandot
+    redan är känt så att resten av tabellen inte behöver gå igenom argparse.
+    """
+    import argparse
 
-    p_tstatus = sub.add_parser(
-        "training-status", help="Visa status för alla träningsordrar"
+    p = argparse.ArgumentParser(prog="manager-cli", description="Managerspelet CLI")
+    p.add_argument(
+        "--file", "-f", default=DEFAULT_SAVE, help="Sökväg till sparfilen (JSON)"
     )
-    p_tstatus.set_defaults(func=cmd_training_status)
+    sub = p.add_subparsers(dest="cmd", required=True)
+    for name, help_text, func, arguments in COMMANDS:
+        if only is not None and name != only:
+            continue
+        sp = sub.add_parser(name, help=help_text)
+        for flags, kwargs in arguments:
+            sp.add_argument(*flags, **kwargs)
+        sp.set_defaults(func=func)
+    return p
+
+
+def _command_token(argv: List[str]) -> Optional[str]:
+    """Första positionella token om det är ett känt kommando, annars None."""
+    i = 0
+    while i < len(argv):
+        tok = argv[i]
+        if tok in ("--file", "-f"):
+            i += 2
+            continue
+        if tok.startswith("-"):
+            return None  # t.ex. --help eller okänd flagga → hela parsern
+        return tok if tok in _COMMAND_NAMES else None
+    return None
 
-    p_advw = sub.add_parser("advance-week", help="Processa en vecka (formträning m.m.)")
-    p_advw.set_defaults(func=cmd_advance_week)
 
-    # --- End Season ---
-    p_end = sub.add_parser(
-        "end-season", help="Avsluta säsongen: spelarförändringar, ny säsong & rapport"
-    )
-    p_end.add_argument(
-        "--report", default="saves/season_report.txt", help="Sökväg för rapportfilen"
-    )
-    p_end.set_defaults(func=cmd_end_season)
+def main() -> None:
+    argv = sys.argv[1:]
+    fast = _fast_args(argv)
+    if fast is not None:
+        fast.func(fast)
+        return
 
-    args = p.parse_args()
+    args = build_parser(_command_token(argv)).parse_args(argv)
     args.func(args)
 
 
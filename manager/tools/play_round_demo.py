@@ -7,11 +7,11 @@ from manager.core import (
     Position,  # <-- viktigt: för att indexera bästa elvan
     Referee,
     TacticName,
-    apply_result_to_table,
+    apply_results_to_table,
     best_xi_442,
     build_league_schedule,
     generate_league,
-    simulate_match,
+    simulate_matches,
     sort_table,
 )
 
@@ -28,25 +28,18 @@ def main() -> None:
     round1 = [m for m in fixtures if m.round == 1]
 
     # 3) Spela alla matcher i omgång 1
-    results = []
-    ref = Referee(skill=7, hard=6)
-    for match in round1:
-        res = simulate_match(
-            match.home,
-            match.away,
-            referee=ref,
-            seed=None,
-            home_tactic=TACTICS[TacticName.BALANCED_442],
-            away_tactic=TACTICS[TacticName.ATTACKING_433],
-            home_aggr=Aggression.MEDEL,
-            away_aggr=Aggression.MEDEL,
-        )
-        results.append(res)
+    results = simulate_matches(
+        round1,
+        referee=Referee(skill=7, hardness=6),
+        home_tactic=TACTICS[TacticName.BALANCED_442],
+        away_tactic=TACTICS[TacticName.ATTACKING_433],
+        home_aggr=Aggression.MEDEL,
+        away_aggr=Aggression.MEDEL,
+    )
 
     # 4) Uppdatera tabell
     table = {}
-    for res in results:
-        apply_result_to_table(table, res)
+    apply_results_to_table(table, results)
 
     sorted_rows = sort_table(table)
 
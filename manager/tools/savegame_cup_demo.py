@@ -3,7 +3,7 @@ from __future__ import annotations
 from manager.core import (
     LeagueRules,
     SeasonConfig,
-    apply_result_to_table,
+    apply_results_to_table,
     build_league_schedule,
     generate_league,
     play_round,
@@ -41,8 +41,7 @@ def main() -> None:
 
     table = {}
     # Spela 1 ligaomgång
-    for res in play_round(fixtures[div.name], 1, cfg):
-        apply_result_to_table(table, res)
+    apply_results_to_table(table, play_round(fixtures[div.name], 1, cfg))
     gs.current_round = 2
 
     # Starta cupen (mitt i säsongen)
@@ -82,16 +81,16 @@ def main() -> None:
             home_aggr=cfg.home_aggr,
             away_aggr=cfg.away_aggr,
         )
-        total_matches = sum(len(r) for r in remaining_rounds)
+        total_matches = sum(map(len, remaining_rounds))
         print(
             f"Cupen färdig! Vinnare: {loaded.cup_state.winner.name} (spelade {total_matches} matcher i de återstående rundorna)"
         )
 
     # Fortsätt ligan 1 runda till
-    for res in play_round(
-        loaded.fixtures_by_division[div.name], loaded.current_round, cfg
-    ):
-        apply_result_to_table(table, res)
+    apply_results_to_table(
+        table,
+        play_round(loaded.fixtures_by_division[div.name], loaded.current_round, cfg),
+    )
     loaded.current_round += 1
 
     # Visa enkel tabellrad count
@@ -3,7 +3,7 @@ from __future__ import annotations
 from manager.core import (
     LeagueRules,
     SeasonConfig,
-    apply_result_to_table,
+    apply_results_to_table,
     build_league_schedule,
     generate_league,
     play_round,
@@ -35,8 +35,9 @@ def main() -> None:
     # 3) Spela 2 omgångar, uppdatera tabell, spara
     table = {}
     for rnd in (1, 2):
-        for res in play_round(fixtures[league.divisions[0].name], rnd, cfg):
-            apply_result_to_table(table, res)
+        apply_results_to_table(
+            table, play_round(fixtures[league.divisions[0].name], rnd, cfg)
+        )
         gs.current_round = rnd + 1
 
     gs.save("saves/savegame.json")
@@ -46,14 +47,11 @@ def main() -> None:
     loaded = GameState.load("saves/savegame.json")
     print(f"Laddade spel: säsong {loaded.season}, nästa omgång: {loaded.current_round}")
 
-    max_round = max(
-        m.round for m in loaded.fixtures_by_division[loaded.league.divisions[0].name]
-    )
+    div_name = loaded.league.divisions[0].name
+    div_fixtures = loaded.fixtures_by_division[div_name]
+    max_round = loaded.last_scheduled_round(div_name)
     for rnd in range(loaded.current_round, max_round + 1):
-        for res in play_round(
-            loaded.fixtures_by_division[loaded.league.divisions[0].name], rnd, cfg
-        ):
-            apply_result_to_table(table, res)
+        apply_results_to_table(table, play_round(div_fixtures, rnd, cfg))
         loaded.current_round = rnd + 1
 
     # 5) Skriv ut sluttabell
@@ -10,15 +10,21 @@ from manager.core import (
     SeasonConfig,
     SeasonRecord,
     TacticName,
-    apply_result_to_table,
+    apply_results_to_table,
     best_xi_442,
     build_league_schedule,
+    create_cup_state,
+    finish_cup,
+    format_match_report,
     generate_league,
-    play_cup,
     play_round,
     sort_table,
 )
 
+SEASON_NUMBER = 1
+# Cupen spelas innan de sista N ligaomgångarna
+CUP_BEFORE_LAST_N_ROUNDS = 3
+
 
 def main() -> None:
     # 1) Setup liga + schema
@@ -27,13 +33,11 @@ def main() -> None:
     schedules = build_league_schedule(league)
     div = league.divisions[0]
     fixtures = schedules[div.name]
-    max_round = max(m.round for m in fixtures)
+    max_round = max((m.round for m in fixtures), default=0)
 
     # 2) Säsongskonfig
     cfg = SeasonConfig(
-        season_number=1,
-        cup_before_last_n_rounds=3,
-        referee=Referee(skill=7, hard=6),
+        referee=Referee(skill=7, hardness=6),
         home_tactic=TACTICS[TacticName.BALANCED_442],
         away_tactic=TACTICS[TacticName.ATTACKING_433],
         home_aggr=Aggression.MEDEL,
@@ -42,32 +46,40 @@ def main() -> None:
 
     history = HistoryStore()
 
-    # 3) Spela ligan t.o.m. (max_round - cup_before_last_n_rounds)
+    # 3) Spela ligan t.o.m. (max_round - CUP_BEFORE_LAST_N_ROUNDS)
     table = {}
     all_results = []
-    stop_before = max_round - cfg.cup_before_last_n_rounds
+    stop_before = max_round - CUP_BEFORE_LAST_N_ROUNDS
     for rnd in range(1, stop_before + 1):
         r = play_round(fixtures, rnd, cfg)
         all_results.extend(r)
-        for res in r:
-            apply_result_to_table(table, res)
+        apply_results_to_table(table, r)
 
     # 4) Spela cupen klart här emellan
     entrants = div.clubs[:]  # alla lag deltar
     cup_rules = CupRules(two_legged=True, final_two_legged=False)
-    cup_rounds, cup_winner, final_txt = play_cup(entrants, cup_rules, cfg)
+    cup_state = create_cup_state(entrants, cup_rules)
+    cup_rounds = finish_cup(
+        cup_state,
+        referee=cfg.referee,
+        home_tactic=cfg.home_tactic,
+        away_tactic=cfg.away_tactic,
+        home_aggr=cfg.home_aggr,
+        away_aggr=cfg.away_aggr,
+    )
+    cup_winner = cup_state.winner
     print("\n=== Cupen ===")
-    print(final_txt)
+    print(format_match_report(cup_rounds[-1][-1]))
+    print(f"Vinnare: {cup_winner.name}")
 
     # 5) Spela färdigt ligan
     last_round_results = []
     for rnd in range(stop_before + 1, max_round + 1):
         r = play_round(fixtures, rnd, cfg)
         if rnd == max_round:
-            last_round_results.extend(r)
+            last_round_results = r
         all_results.extend(r)
-        for res in r:
-            apply_result_to_table(table, res)
+        apply_results_to_table(table, r)
 
     final_rows = sort_table(table)
     print(f"\n=== SLUTTABELL: {div.name} ===")
@@ -102,10 +114,10 @@ def main() -> None:
     # 7) Historik
     for i, row in enumerate(final_rows, start=1):
         history.add_record(
-            row.club.name, SeasonRecord(season=cfg.season_number, league_position=i)
+            row.club.name, SeasonRecord(season=SEASON_NUMBER, league_position=i)
         )
     history.add_record(
-        cup_winner.name, SeasonRecord(season=cfg.season_number, cup_result="Vinnare")
+        cup_winner.name, SeasonRecord(season=SEASON_NUMBER, cup_result="Vinnare")
     )
 
     print("\n=== Historik (snapshot) ===")
@@ -0,0 +1,52 @@
+import random
+
+import pytest
+
+from manager.core import (
+    GameState,
+    HistoryStore,
+    LeagueRules,
+    build_league_schedule,
+    generate_league,
+)
+
+
+@pytest.fixture
+def league():
+    """Liten seedad liga (en division, sex lag)."""
+    random.seed(1234)
+    rules = LeagueRules(format="rak", teams_per_div=6, levels=1, double_round=True)
+    return generate_league("Testliga", rules)
+
+
+@pytest.fixture
+def fixtures(league):
+    """Schemat för ligans första division."""
+    return build_league_schedule(league)[league.divisions[0].name]
+
+
+def new_state(league):
+    """GameState för en ny säsong, som i `cli new`."""
+    gs = GameState(
+        season=1,
+        league=league,
+        fixtures_by_division=build_league_schedule(league),
+        current_round=1,
+        history=HistoryStore(),
+        cup_state=None,
+    )
+    gs.ensure_containers()
+    return gs
+
+
+@pytest.fixture
+def state(league):
+    return new_state(league)
+
+
+@pytest.fixture
+def pyramid_state():
+    """GameState med två divisioner (fyra lag vardera)."""
+    random.seed(4321)
+    rules = LeagueRules(format="pyramid", teams_per_div=4, levels=2)
+    return new_state(generate_league("Pyramidliga", rules))
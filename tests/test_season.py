@@ -0,0 +1,35 @@
+import random
+
+from manager.core.season import SeasonConfig, play_round
+from manager.core.standings import apply_results_to_table
+
+
+def test_parallel_play_round_rebinds_to_fixture_objects(fixtures):
+    random.seed(5)
+    todays = [m for m in fixtures if m.round == 1]
+
+    results = play_round(fixtures, 1, SeasonConfig(), workers=2)
+
+    assert len(results) == len(todays)
+    for res, m in zip(results, todays):
+        # Resultaten från arbetsprocesserna pekar på schemats egna objekt
+        assert res.home is m.home
+        assert res.away is m.away
+        squad = {id(p) for p in m.home.players + m.away.players}
+        for ev in res.events:
+            if ev.player is not None:
+                assert id(ev.player) in squad
+            if ev.assist_by is not None:
+                assert id(ev.assist_by) in squad
+
+
+def test_parallel_play_round_results_feed_the_table(fixtures):
+    random.seed(6)
+    table = {}
+    apply_results_to_table(table, play_round(fixtures, 1, SeasonConfig(), workers=3))
+
+    clubs = {m.home.name for m in fixtures} | {m.away.name for m in fixtures}
+    assert set(table) <= clubs
+    assert sum(row.mp for row in table.values()) == 2 * len(
+        [m for m in fixtures if m.round == 1]
+    )
@@ -0,0 +1,140 @@
+import json
+import pickle
+import random
+
+import pytest
+
+from manager.core.history import SeasonRecord
+from manager.core.season import SeasonConfig, play_round
+from manager.core.state import GameState
+from manager.core.stats import update_stats_from_results_batch
+
+
+@pytest.fixture
+def played_state(state):
+    """GameState efter en spelad ligaomgång med statistik och matchlogg."""
+    random.seed(11)
+    fixtures = state.fixtures_by_division[state.league.divisions[0].name]
+    records = update_stats_from_results_batch(
+        play_round(fixtures, 1, SeasonConfig()),
+        competition="league",
+        round_no=1,
+        player_stats=state.player_stats,
+        club_stats=state.club_stats,
+    )
+    state.record_matches(records)
+    state.current_round = 2
+    return state
+
+
+def test_load_partial_reads_only_requested_sections(played_state, tmp_path):
+    path = tmp_path / "career.json"
+    played_state.save(path)
+
+    gs = GameState.load_partial(path, {"league", "cup_state"})
+
+    assert gs.partial
+    assert gs.current_round == 2
+    assert [c.name for c in gs.league.divisions[0].clubs] == [
+        c.name for c in played_state.league.divisions[0].clubs
+    ]
+    assert gs.match_log == [] and gs.player_stats == {}
+    # Storlekar finns kvar för överhoppade sektioner
+    assert gs.section_size("match_log") == len(played_state.match_log)
+    assert gs.section_size("club_stats") == len(played_state.club_stats)
+    assert gs.section_size("player_stats") == len(played_state.player_stats)
+
+
+def test_partial_state_refuses_to_save(played_state, tmp_path):
+    path = tmp_path / "career.json"
+    played_state.save(path)
+    before = path.read_bytes()
+
+    gs = GameState.load_partial(path, {"league"})
+    with pytest.raises(ValueError):
+        gs.save(path)
+
+    assert path.read_bytes() == before
+    full = GameState.load(path)
+    assert not full.partial
+    assert len(full.match_log) == len(played_state.match_log)
+
+
+def test_load_partial_reads_pickle_saves_in_full(played_state, tmp_path):
+    path = tmp_path / "career.pkl"
+    played_state.save(path)
+
+    gs = GameState.load_partial(path, {"league"})
+
+    assert not gs.partial
+    assert len(gs.match_log) == len(played_state.match_log)
+    assert gs.club_stats.keys() == played_state.club_stats.keys()
+    gs.save(path)
+
+
+def test_pickle_data_outside_pkl_file_is_refused(played_state, tmp_path):
+    pkl = tmp_path / "career.pkl"
+    played_state.save(pkl)
+    disguised = tmp_path / "shared.json"
+    disguised.write_bytes(pkl.read_bytes())
+
+    with pytest.raises(ValueError):
+        GameState.load(disguised)
+    with pytest.raises(ValueError):
+        GameState.load_partial(disguised, {"league"})
+
+
+def test_pickle_save_leaves_out_derived_caches(played_state, tmp_path):
+    path = tmp_path / "career.pkl"
+    played_state.find_club(played_state.league.divisions[0].clubs[0].name)
+    played_state.save(path)
+
+    state = pickle.loads(path.read_bytes()).__getstate__()
+    for name in ("club_index", "player_index", "schedule_rounds", "section_sizes"):
+        assert name not in state
+    assert "partial" not in state
+
+    gs = GameState.load(path)
+    club = played_state.league.divisions[0].clubs[0]
+    assert gs.find_club(club.name).name == club.name
+    assert gs.max_cup_round == played_state.max_cup_round
+
+
+def _history_state(state):
+    clubs = [c.name for c in state.league.divisions[0].clubs]
+    state.history.add_record(clubs[0], SeasonRecord(1, 1, "Vinnare"))
+    state.history.add_record(clubs[0], SeasonRecord(2, 3, None))
+    state.history.add_record(clubs[1], SeasonRecord(1, 2, "Final"))
+    return clubs[:2]
+
+
+def _assert_same_history(gs, expected, clubs):
+    for club in clubs:
+        records = gs.history.all_for(club)
+        assert all(isinstance(r, SeasonRecord) for r in records)
+        assert records == expected.history.all_for(club)
+
+
+def test_history_round_trips_through_save(state, tmp_path):
+    clubs = _history_state(state)
+    path = tmp_path / "career.json"
+    state.save(path)
+
+    gs = GameState.load(path)
+
+    _assert_same_history(gs, state, clubs)
+    assert gs.history.last_record(clubs[0]).season == 2
+
+
+def test_history_loads_legacy_store_shape(state, tmp_path):
+    clubs = _history_state(state)
+    path = tmp_path / "career.json"
+    state.save(path)
+    # Äldre sparfiler skrev HistoryStore.__dict__, dvs {"_store": {...}}
+    data = json.loads(path.read_bytes())
+    data["history"] = {"_store": data["history"]}
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+    gs = GameState.load(path)
+
+    _assert_same_history(gs, state, clubs)
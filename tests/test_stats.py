@@ -0,0 +1,109 @@
+import random
+from dataclasses import fields
+
+import pytest
+
+from manager.core.season import SeasonConfig, play_round
+from manager.core.serialize import (
+    dumps_json,
+    loads_json,
+    match_log_from_dict_list,
+    match_log_to_dict_list,
+)
+from manager.core.stats import (
+    ClubSeasonStats,
+    PlayerSeasonStats,
+    update_stats_from_results_batch,
+)
+
+
+def _play_rounds(fixtures, rounds):
+    random.seed(99)
+    cfg = SeasonConfig()
+    return [play_round(fixtures, rnd, cfg) for rnd in rounds]
+
+
+def _batch(results_per_round, workers):
+    player_stats = {}
+    club_stats = {}
+    records = []
+    for rnd, results in enumerate(results_per_round, start=1):
+        records += update_stats_from_results_batch(
+            results,
+            competition="league",
+            round_no=rnd,
+            player_stats=player_stats,
+            club_stats=club_stats,
+            workers=workers,
+        )
+    return records, player_stats, club_stats
+
+
+def _assert_same_stats(serial, parallel, cls):
+    assert serial.keys() == parallel.keys()
+    for key, s in serial.items():
+        p = parallel[key]
+        for f in fields(cls):
+            if f.name == "rating_sum":
+                assert getattr(p, f.name) == pytest.approx(getattr(s, f.name))
+            else:
+                assert getattr(p, f.name) == getattr(s, f.name), (key, f.name)
+
+
+def test_batch_workers_match_serial_stats(fixtures):
+    results = _play_rounds(fixtures, range(1, 4))
+
+    s_records, s_players, s_clubs = _batch(results, workers=1)
+    p_records, p_players, p_clubs = _batch(results, workers=3)
+
+    _assert_same_stats(s_players, p_players, PlayerSeasonStats)
+    _assert_same_stats(s_clubs, p_clubs, ClubSeasonStats)
+
+    assert len(p_records) == len(s_records)
+    for s, p in zip(s_records, p_records):
+        assert (p.round, p.home, p.away) == (s.round, s.home, s.away)
+        assert (p.home_goals, p.away_goals) == (s.home_goals, s.away_goals)
+        assert p.event_types == s.event_types
+        assert p.event_player_ids == s.event_player_ids
+        assert p.ratings == pytest.approx(s.ratings)
+
+
+def test_batch_counts_every_match(fixtures):
+    results = _play_rounds(fixtures, [1])[0]
+    _, _, club_stats = _batch([results], workers=3)
+
+    assert sum(cs.played for cs in club_stats.values()) == 2 * len(results)
+    goals = sum(r.home_stats.goals + r.away_stats.goals for r in results)
+    assert sum(cs.goals_for for cs in club_stats.values()) == goals
+
+
+def test_legacy_events_list_loads_as_columns():
+    events = [
+        {"type": "goal", "minute": 12, "player_id": 7, "assist_id": 9},
+        {"type": "yellow", "minute": 55, "player_id": 3, "assist_id": None},
+    ]
+    legacy = {
+        "competition": "league",
+        "round": 2,
+        "home": "Hemma IF",
+        "away": "Borta BK",
+        "home_goals": 1,
+        "away_goals": 0,
+        "events": events,
+        "ratings": {"7": 7.5},
+    }
+
+    (mr,) = match_log_from_dict_list([legacy])
+    assert mr.event_types == ["goal", "yellow"]
+    assert mr.event_minutes == [12, 55]
+    assert mr.event_player_ids == [7, 3]
+    assert mr.event_assist_ids == [9, None]
+    assert mr.ratings == {7: 7.5}
+    assert mr.events == events
+
+    # Sparas i nya kolumnformatet och läses tillbaka oförändrat
+    saved = loads_json(dumps_json(match_log_to_dict_list([mr])))
+    assert "events" not in saved[0]
+    (again,) = match_log_from_dict_list(saved)
+    assert again == mr
+    assert again.events == events
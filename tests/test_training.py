@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+from manager.core.player import Player, Position, Trait, trait_bit, traits_mask
+from manager.core.serialize import player_from_dict, player_to_dict
+from manager.core.training import advance_week, start_form_training
+
+
+def test_form_training_finds_club_outside_first_division(pyramid_state):
+    gs = pyramid_state
+    club = gs.league.divisions[1].clubs[0]
+    # generate_league återanvänder lagnamnen per division → gör namnet unikt
+    club.name = "Nedre IK"
+    player = club.players[0]
+    club.cash_sek = 200_000
+    player.form_now = 10
+
+    order = start_form_training(gs, club.name.upper(), player.id)
+
+    assert order.club_name == club.name
+    assert club.cash_sek == 0
+    logs = advance_week(gs, rng=random.Random(0))
+    assert len(logs) == 1 and logs[0].startswith(club.name)
+    assert player.form_now > 10
+    assert order.status == "done"
+
+
+def test_form_training_unknown_club(pyramid_state):
+    with pytest.raises(ValueError):
+        start_form_training(pyramid_state, "Finns Inte FF", 1)
+
+
+def _train_once(gs, club, player, seed):
+    club.cash_sek = 200_000
+    player.form_now = 5
+    start_form_training(gs, club.name, player.id)
+    advance_week(gs, rng=random.Random(seed))
+    return player.form_now - 5
+
+
+def test_training_keen_player_gets_bonus(state):
+    club = state.league.divisions[0].clubs[0]
+    keen, plain = club.players[0], club.players[1]
+    keen.set_traits([Trait.TRANINGSVILLIG])
+    plain.set_traits([])
+
+    for seed in range(5):
+        # Samma seed → samma basboost; traiten ger 1–3 extra
+        extra = _train_once(state, club, keen, seed) - _train_once(
+            state, club, plain, seed
+        )
+        assert 1 <= extra <= 3
+
+
+def test_trait_mask_follows_set_traits_after_load():
+    original = Player(
+        id=7,
+        first_name="Test",
+        last_name="Spelare",
+        age=24,
+        position=Position.MF,
+        number=8,
+        traits=[Trait.TRANINGSVILLIG],
+    )
+    loaded = player_from_dict(player_to_dict(original))
+    assert loaded.trait_mask == trait_bit(Trait.TRANINGSVILLIG)
+
+    loaded.set_traits([])
+    assert loaded.trait_mask == 0
+    loaded.set_traits([Trait.TRANINGSVILLIG, Trait.INTELLIGENT])
+    assert loaded.trait_mask == traits_mask(loaded.traits)
+    assert loaded.trait_mask & trait_bit(Trait.TRANINGSVILLIG)